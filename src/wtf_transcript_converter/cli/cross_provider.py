@@ -5,9 +5,10 @@ This module provides CLI commands for testing consistency, performance, and qual
 across multiple transcription providers.
 """
 
-import json
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
 
 import click
 from rich.console import Console
@@ -15,8 +16,307 @@ from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.table import Table
 
+from ..utils.json_utils import dumps, load_file
+
 console = Console()
 
+# (results, analysis, report) produced by each cross-provider run; the report is
+# only generated when it will be displayed or saved
+RunOutput = Tuple[List[Any], Dict[str, Any], Optional[str]]
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Prebuilt number formatters for summary table cells
+_FMT3 = "{:.3f}".format
+_FMT2 = "{:.2f}".format
+_FMT_SECONDS = "{:.2f}s".format
+
+
+def _common_options(f: F) -> F:
+    """Add the input file argument and verbose flag shared by every subcommand."""
+    f = click.option(
+        "--verbose", "-v", is_flag=True, help="Verbose output with detailed reports"
+    )(f)
+    return click.argument("input_file", type=click.Path(exists=True))(f)
+
+
+_report_output_option = click.option(
+    "--output", "-o", type=click.Path(), help="Output report file"
+)
+
+
+def _notify(on_stage: Optional[Callable[[str], None]], stage: str) -> None:
+    """Report progress to the caller if a stage callback was given."""
+    if on_stage is not None:
+        on_stage(stage)
+
+
+def _run_consistency(
+    input_data: Dict[str, Any],
+    include_report: bool = True,
+    on_stage: Optional[Callable[[str], None]] = None,
+) -> RunOutput:
+    """Run the consistency test on parsed input data."""
+    from ..cross_provider import CrossProviderConsistencyTester
+
+    tester = CrossProviderConsistencyTester()
+    results = tester.test_consistency_with_sample_data(input_data)
+    _notify(on_stage, "Analyzing results...")
+    analysis = tester.analyze_consistency(results)
+    report = None
+    if include_report:
+        _notify(on_stage, "Generating report...")
+        report = tester.generate_consistency_report(results)
+    return results, analysis, report
+
+
+def _run_performance(
+    input_data: Dict[str, Any],
+    iterations: int,
+    include_report: bool = True,
+    on_stage: Optional[Callable[[str], None]] = None,
+) -> RunOutput:
+    """Run the performance benchmark on parsed input data."""
+    from ..cross_provider import PerformanceBenchmark
+
+    benchmark = PerformanceBenchmark()
+    results = benchmark.benchmark_all_providers(input_data, iterations=iterations)
+    _notify(on_stage, "Analyzing performance...")
+    analysis = benchmark.analyze_performance(results)
+    report = None
+    if include_report:
+        _notify(on_stage, "Generating report...")
+        report = benchmark.generate_performance_report(results, analysis)
+    return results, analysis, report
+
+
+def _run_quality(
+    input_data: Dict[str, Any],
+    include_report: bool = True,
+    on_stage: Optional[Callable[[str], None]] = None,
+) -> RunOutput:
+    """Run the quality comparison on parsed input data."""
+    from ..cross_provider import QualityComparator
+
+    comparator = QualityComparator()
+    results = comparator.compare_quality_across_providers(input_data)
+    _notify(on_stage, "Comparing results...")
+    analysis = comparator.analyze_quality_comparison(results)
+    report = None
+    if include_report:
+        _notify(on_stage, "Generating report...")
+        report = comparator.generate_quality_report(results, analysis)
+    return results, analysis, report
+
+
+def _consistency_row(r: Any) -> Dict[str, Any]:
+    """Build the saved report entry for a consistency result."""
+    return {
+        "provider": r.provider,
+        "success": r.is_valid,
+        "confidence": r.confidence_score,
+        "word_count": r.word_count,
+        "segment_count": r.segment_count,
+        "duration": r.duration,
+        "errors": r.validation_errors,
+    }
+
+
+def _performance_row(r: Any) -> Dict[str, Any]:
+    """Build the saved report entry for a performance result."""
+    return {
+        "provider": r.provider,
+        "success": r.success,
+        "conversion_time": r.conversion_time,
+        "memory_usage_mb": r.memory_usage_mb,
+        "cpu_usage_percent": r.cpu_usage_percent,
+        "wtf_doc_size_kb": r.wtf_doc_size_kb,
+        "error": r.error_message,
+    }
+
+
+def _quality_row(r: Any) -> Dict[str, Any]:
+    """Build the saved report entry for a quality result."""
+    return {
+        "provider": r.provider,
+        "success": r.success,
+        "overall_confidence": r.overall_confidence,
+        "word_count": r.word_count,
+        "avg_word_confidence": r.avg_word_confidence,
+        "low_confidence_words": r.low_confidence_words,
+        "punctuation_accuracy": r.punctuation_accuracy,
+        "text_completeness": r.text_completeness,
+        "timing_accuracy": r.timing_accuracy,
+        "error": r.error_message,
+    }
+
+
+def _nest(data: bytes, level: int) -> bytes:
+    """Re-indent serialized JSON so it can be embedded at the given nesting level."""
+    return data.replace(b"\n", b"\n" + b"  " * level)
+
+
+def _write_report(
+    output: str,
+    analysis: Dict[str, Any],
+    results: List[Any],
+    report: Optional[str],
+    row_fn: Callable[[Any], Dict[str, Any]],
+) -> None:
+    """
+    Write a report file, serializing one result row at a time.
+
+    The output is identical to dumping {"analysis", "results", "report"} in a
+    single call, without materializing the list of result rows in memory.
+    """
+    with open(output, "wb") as f:
+        f.write(b'{\n  "analysis": ')
+        f.write(_nest(dumps(analysis), 1))
+        f.write(b',\n  "results": [')
+        for i, result in enumerate(results):
+            f.write(b",\n    " if i else b"\n    ")
+            f.write(_nest(dumps(row_fn(result)), 2))
+        f.write(b"\n  ]" if results else b"]")
+        f.write(b',\n  "report": ')
+        f.write(dumps(report))
+        f.write(b"\n}")
+
+
+def _show_consistency(
+    results: List[Any],
+    analysis: Dict[str, Any],
+    report: Optional[str],
+    output: Optional[str],
+    verbose: bool,
+) -> None:
+    """Display and optionally save consistency results."""
+    if verbose:
+        console.print(Panel(report or "", title="Consistency Report", border_style="blue"))
+    else:
+        # Summary table
+        table = Table(title="Consistency Summary")
+        table.add_column("Provider", style="cyan")
+        table.add_column("Status", style="green")
+        table.add_column("Confidence", style="yellow")
+        table.add_column("Words", style="magenta")
+        table.add_column("Duration", style="blue")
+
+        for result in results:
+            if result.is_valid:
+                table.add_row(
+                    result.provider,
+                    "✅ Valid",
+                    _FMT3(result.confidence_score),
+                    str(result.word_count),
+                    _FMT_SECONDS(result.duration),
+                )
+            else:
+                table.add_row(result.provider, "❌ Failed", "N/A", "N/A", "N/A")
+
+        console.print(table)
+
+    # Save report if requested
+    if output:
+        _write_report(output, analysis, results, report, _consistency_row)
+        console.print(f"[green]Report saved to {output}[/green]")
+
+    # Overall status
+    if analysis["status"] == "consistent":
+        console.print("[green]✅ Providers are consistent![/green]")
+    else:
+        console.print("[yellow]⚠️  Providers show some inconsistencies[/yellow]")
+
+
+def _show_performance(
+    results: List[Any],
+    analysis: Dict[str, Any],
+    report: Optional[str],
+    output: Optional[str],
+    verbose: bool,
+) -> None:
+    """Display and optionally save performance results."""
+    if verbose:
+        console.print(Panel(report or "", title="Performance Report", border_style="green"))
+    else:
+        # Summary table
+        table = Table(title="Performance Summary")
+        table.add_column("Provider", style="cyan")
+        table.add_column("Status", style="green")
+        table.add_column("Time (s)", style="yellow")
+        table.add_column("Memory (MB)", style="magenta")
+        table.add_column("Output (KB)", style="blue")
+
+        for result in results:
+            if result.success:
+                table.add_row(
+                    result.provider,
+                    "✅ Success",
+                    _FMT3(result.conversion_time),
+                    _FMT2(result.memory_usage_mb),
+                    _FMT2(result.wtf_doc_size_kb),
+                )
+            else:
+                table.add_row(result.provider, "❌ Failed", "N/A", "N/A", "N/A")
+
+        console.print(table)
+
+    # Save report if requested
+    if output:
+        _write_report(output, analysis, results, report, _performance_row)
+        console.print(f"[green]Report saved to {output}[/green]")
+
+    # Performance insights
+    if analysis["status"] == "success":
+        fastest = analysis["metrics"]["conversion_time"]["fastest"]
+        fastest_time = analysis["metrics"]["conversion_time"]["fastest_time"]
+        console.print(f"[green]🏆 Fastest provider: {fastest} ({fastest_time:.3f}s)[/green]")
+
+
+def _show_quality(
+    results: List[Any],
+    analysis: Dict[str, Any],
+    report: Optional[str],
+    output: Optional[str],
+    verbose: bool,
+) -> None:
+    """Display and optionally save quality results."""
+    if verbose:
+        console.print(Panel(report or "", title="Quality Report", border_style="yellow"))
+    else:
+        # Summary table
+        table = Table(title="Quality Summary")
+        table.add_column("Provider", style="cyan")
+        table.add_column("Status", style="green")
+        table.add_column("Confidence", style="yellow")
+        table.add_column("Words", style="magenta")
+        table.add_column("Low Conf", style="red")
+        table.add_column("Punctuation", style="blue")
+
+        for result in results:
+            if result.success:
+                table.add_row(
+                    result.provider,
+                    "✅ Success",
+                    _FMT3(result.overall_confidence),
+                    str(result.word_count),
+                    str(result.low_confidence_words),
+                    _FMT3(result.punctuation_accuracy),
+                )
+            else:
+                table.add_row(result.provider, "❌ Failed", "N/A", "N/A", "N/A", "N/A")
+
+        console.print(table)
+
+    # Save report if requested
+    if output:
+        _write_report(output, analysis, results, report, _quality_row)
+        console.print(f"[green]Report saved to {output}[/green]")
+
+    # Quality insights
+    if analysis["status"] == "success":
+        best_conf = analysis["best_performers"]["overall_confidence"]
+        console.print(f"[green]🏆 Best confidence: {best_conf}[/green]")
+
 
 @click.group()
 def cross_provider() -> None:
@@ -25,27 +325,20 @@ def cross_provider() -> None:
 
 
 @cross_provider.command()
-@click.argument("input_file", type=click.Path(exists=True))
 @click.option(
     "--output",
     "-o",
     type=click.Path(),
     help="Output report file (default: cross_provider_report.json)",
 )
-@click.option("--verbose", "-v", is_flag=True, help="Verbose output with detailed reports")
+@_common_options
 def consistency(input_file: str, output: Optional[str], verbose: bool) -> None:
     """Test consistency across all providers using the same input data."""
     console.print(f"[blue]Testing consistency across providers with {input_file}...[/blue]")
 
     try:
         # Load input data
-        with open(input_file, "r", encoding="utf-8") as f:
-            input_data = json.load(f)
-
-        # Import the consistency tester
-        from ..cross_provider import CrossProviderConsistencyTester
-
-        tester = CrossProviderConsistencyTester()
+        input_data = load_file(input_file)
 
         with Progress(
             SpinnerColumn(),
@@ -54,63 +347,13 @@ def consistency(input_file: str, output: Optional[str], verbose: bool) -> None:
             disable=not verbose,
         ) as progress:
             task = progress.add_task("Testing consistency...", total=None)
-            results = tester.test_consistency_with_sample_data(input_data)
-            progress.update(task, description="Analyzing results...")
-            analysis = tester.analyze_consistency(results)
-            progress.update(task, description="Generating report...")
-            report = tester.generate_consistency_report(results)
+            results, analysis, report = _run_consistency(
+                input_data,
+                verbose or bool(output),
+                lambda stage: progress.update(task, description=stage),
+            )
 
-        # Display results
-        if verbose:
-            console.print(Panel(report, title="Consistency Report", border_style="blue"))
-        else:
-            # Summary table
-            table = Table(title="Consistency Summary")
-            table.add_column("Provider", style="cyan")
-            table.add_column("Status", style="green")
-            table.add_column("Confidence", style="yellow")
-            table.add_column("Words", style="magenta")
-            table.add_column("Duration", style="blue")
-
-            for result in results:
-                status = "✅ Valid" if result.is_valid else "❌ Failed"
-                confidence = f"{result.confidence_score:.3f}" if result.is_valid else "N/A"
-                words = str(result.word_count) if result.is_valid else "N/A"
-                duration = f"{result.duration:.2f}s" if result.is_valid else "N/A"
-
-                table.add_row(result.provider, status, confidence, words, duration)
-
-            console.print(table)
-
-        # Save report if requested
-        if output:
-            report_data = {
-                "analysis": analysis,
-                "results": [
-                    {
-                        "provider": r.provider,
-                        "success": r.is_valid,
-                        "confidence": r.confidence_score,
-                        "word_count": r.word_count,
-                        "segment_count": r.segment_count,
-                        "duration": r.duration,
-                        "errors": r.validation_errors,
-                    }
-                    for r in results
-                ],
-                "report": report,
-            }
-
-            with open(output, "w", encoding="utf-8") as f:
-                json.dump(report_data, f, indent=2, ensure_ascii=False)
-
-            console.print(f"[green]Report saved to {output}[/green]")
-
-        # Overall status
-        if analysis["status"] == "consistent":
-            console.print("[green]✅ Providers are consistent![/green]")
-        else:
-            console.print("[yellow]⚠️  Providers show some inconsistencies[/yellow]")
+        _show_consistency(results, analysis, report, output, verbose)
 
     except Exception as e:
         console.print(f"[red]Error during consistency testing: {e}[/red]")
@@ -121,23 +364,16 @@ def consistency(input_file: str, output: Optional[str], verbose: bool) -> None:
 
 
 @cross_provider.command()
-@click.argument("input_file", type=click.Path(exists=True))
 @click.option("--iterations", "-i", default=3, help="Number of benchmark iterations")
-@click.option("--output", "-o", type=click.Path(), help="Output report file")
-@click.option("--verbose", "-v", is_flag=True, help="Verbose output with detailed reports")
+@_report_output_option
+@_common_options
 def performance(input_file: str, iterations: int, output: Optional[str], verbose: bool) -> None:
     """Benchmark performance across all providers."""
     console.print(f"[blue]Benchmarking performance across providers with {input_file}...[/blue]")
 
     try:
         # Load input data
-        with open(input_file, "r", encoding="utf-8") as f:
-            input_data = json.load(f)
-
-        # Import the performance benchmark
-        from ..cross_provider import PerformanceBenchmark
-
-        benchmark = PerformanceBenchmark()
+        input_data = load_file(input_file)
 
         with Progress(
             SpinnerColumn(),
@@ -146,63 +382,14 @@ def performance(input_file: str, iterations: int, output: Optional[str], verbose
             disable=not verbose,
         ) as progress:
             task = progress.add_task("Benchmarking providers...", total=None)
-            results = benchmark.benchmark_all_providers(input_data, iterations=iterations)
-            progress.update(task, description="Analyzing performance...")
-            analysis = benchmark.analyze_performance(results)
-            progress.update(task, description="Generating report...")
-            report = benchmark.generate_performance_report(results)
+            results, analysis, report = _run_performance(
+                input_data,
+                iterations,
+                verbose or bool(output),
+                lambda stage: progress.update(task, description=stage),
+            )
 
-        # Display results
-        if verbose:
-            console.print(Panel(report, title="Performance Report", border_style="green"))
-        else:
-            # Summary table
-            table = Table(title="Performance Summary")
-            table.add_column("Provider", style="cyan")
-            table.add_column("Status", style="green")
-            table.add_column("Time (s)", style="yellow")
-            table.add_column("Memory (MB)", style="magenta")
-            table.add_column("Output (KB)", style="blue")
-
-            for result in results:
-                status = "✅ Success" if result.success else "❌ Failed"
-                time_str = f"{result.conversion_time:.3f}" if result.success else "N/A"
-                memory_str = f"{result.memory_usage_mb:.2f}" if result.success else "N/A"
-                size_str = f"{result.wtf_doc_size_kb:.2f}" if result.success else "N/A"
-
-                table.add_row(result.provider, status, time_str, memory_str, size_str)
-
-            console.print(table)
-
-        # Save report if requested
-        if output:
-            report_data = {
-                "analysis": analysis,
-                "results": [
-                    {
-                        "provider": r.provider,
-                        "success": r.success,
-                        "conversion_time": r.conversion_time,
-                        "memory_usage_mb": r.memory_usage_mb,
-                        "cpu_usage_percent": r.cpu_usage_percent,
-                        "wtf_doc_size_kb": r.wtf_doc_size_kb,
-                        "error": r.error_message,
-                    }
-                    for r in results
-                ],
-                "report": report,
-            }
-
-            with open(output, "w", encoding="utf-8") as f:
-                json.dump(report_data, f, indent=2, ensure_ascii=False)
-
-            console.print(f"[green]Report saved to {output}[/green]")
-
-        # Performance insights
-        if analysis["status"] == "success":
-            fastest = analysis["metrics"]["conversion_time"]["fastest"]
-            fastest_time = analysis["metrics"]["conversion_time"]["fastest_time"]
-            console.print(f"[green]🏆 Fastest provider: {fastest} ({fastest_time:.3f}s)[/green]")
+        _show_performance(results, analysis, report, output, verbose)
 
     except Exception as e:
         console.print(f"[red]Error during performance benchmarking: {e}[/red]")
@@ -213,22 +400,15 @@ def performance(input_file: str, iterations: int, output: Optional[str], verbose
 
 
 @cross_provider.command()
-@click.argument("input_file", type=click.Path(exists=True))
-@click.option("--output", "-o", type=click.Path(), help="Output report file")
-@click.option("--verbose", "-v", is_flag=True, help="Verbose output with detailed reports")
+@_report_output_option
+@_common_options
 def quality(input_file: str, output: Optional[str], verbose: bool) -> None:
     """Compare quality across all providers."""
     console.print(f"[blue]Comparing quality across providers with {input_file}...[/blue]")
 
     try:
         # Load input data
-        with open(input_file, "r", encoding="utf-8") as f:
-            input_data = json.load(f)
-
-        # Import the quality comparator
-        from ..cross_provider import QualityComparator
-
-        comparator = QualityComparator()
+        input_data = load_file(input_file)
 
         with Progress(
             SpinnerColumn(),
@@ -237,67 +417,13 @@ def quality(input_file: str, output: Optional[str], verbose: bool) -> None:
             disable=not verbose,
         ) as progress:
             task = progress.add_task("Analyzing quality...", total=None)
-            results = comparator.compare_quality_across_providers(input_data)
-            progress.update(task, description="Comparing results...")
-            analysis = comparator.analyze_quality_comparison(results)
-            progress.update(task, description="Generating report...")
-            report = comparator.generate_quality_report(results)
+            results, analysis, report = _run_quality(
+                input_data,
+                verbose or bool(output),
+                lambda stage: progress.update(task, description=stage),
+            )
 
-        # Display results
-        if verbose:
-            console.print(Panel(report, title="Quality Report", border_style="yellow"))
-        else:
-            # Summary table
-            table = Table(title="Quality Summary")
-            table.add_column("Provider", style="cyan")
-            table.add_column("Status", style="green")
-            table.add_column("Confidence", style="yellow")
-            table.add_column("Words", style="magenta")
-            table.add_column("Low Conf", style="red")
-            table.add_column("Punctuation", style="blue")
-
-            for result in results:
-                status = "✅ Success" if result.success else "❌ Failed"
-                confidence = f"{result.overall_confidence:.3f}" if result.success else "N/A"
-                words = str(result.word_count) if result.success else "N/A"
-                low_conf = str(result.low_confidence_words) if result.success else "N/A"
-                punctuation = f"{result.punctuation_accuracy:.3f}" if result.success else "N/A"
-
-                table.add_row(result.provider, status, confidence, words, low_conf, punctuation)
-
-            console.print(table)
-
-        # Save report if requested
-        if output:
-            report_data = {
-                "analysis": analysis,
-                "results": [
-                    {
-                        "provider": r.provider,
-                        "success": r.success,
-                        "overall_confidence": r.overall_confidence,
-                        "word_count": r.word_count,
-                        "avg_word_confidence": r.avg_word_confidence,
-                        "low_confidence_words": r.low_confidence_words,
-                        "punctuation_accuracy": r.punctuation_accuracy,
-                        "text_completeness": r.text_completeness,
-                        "timing_accuracy": r.timing_accuracy,
-                        "error": r.error_message,
-                    }
-                    for r in results
-                ],
-                "report": report,
-            }
-
-            with open(output, "w", encoding="utf-8") as f:
-                json.dump(report_data, f, indent=2, ensure_ascii=False)
-
-            console.print(f"[green]Report saved to {output}[/green]")
-
-        # Quality insights
-        if analysis["status"] == "success":
-            best_conf = analysis["best_performers"]["overall_confidence"]
-            console.print(f"[green]🏆 Best confidence: {best_conf}[/green]")
+        _show_quality(results, analysis, report, output, verbose)
 
     except Exception as e:
         console.print(f"[red]Error during quality comparison: {e}[/red]")
@@ -308,10 +434,9 @@ def quality(input_file: str, output: Optional[str], verbose: bool) -> None:
 
 
 @cross_provider.command()
-@click.argument("input_file", type=click.Path(exists=True))
 @click.option("--output-dir", "-o", type=click.Path(), help="Output directory for reports")
 @click.option("--iterations", "-i", default=3, help="Number of benchmark iterations")
-@click.option("--verbose", "-v", is_flag=True, help="Verbose output")
+@_common_options
 def all(input_file: str, output_dir: Optional[str], iterations: int, verbose: bool) -> None:
     """Run all cross-provider tests (consistency, performance, quality)."""
     console.print(
@@ -324,29 +449,59 @@ def all(input_file: str, output_dir: Optional[str], iterations: int, verbose: bo
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
 
-    # Run consistency test
-    console.print("\n[cyan]1. Testing Consistency...[/cyan]")
-    consistency_output = str(output_path / "consistency_report.json") if output_path else None
-    try:
-        consistency(input_file, consistency_output, verbose)
-    except Exception as e:
-        console.print(f"[red]Consistency test failed: {e}[/red]")
-
-    # Run performance test
-    console.print("\n[cyan]2. Benchmarking Performance...[/cyan]")
-    performance_output = str(output_path / "performance_report.json") if output_path else None
-    try:
-        performance(input_file, iterations, performance_output, verbose)
-    except Exception as e:
-        console.print(f"[red]Performance test failed: {e}[/red]")
+    def report_file(name: str) -> Optional[str]:
+        return str(output_path / name) if output_path else None
 
-    # Run quality test
-    console.print("\n[cyan]3. Comparing Quality...[/cyan]")
-    quality_output = str(output_path / "quality_report.json") if output_path else None
+    # Load input data once and share it across all three analyses
     try:
-        quality(input_file, quality_output, verbose)
+        input_data = load_file(input_file)
     except Exception as e:
-        console.print(f"[red]Quality test failed: {e}[/red]")
+        console.print(f"[red]Error reading input file: {e}[/red]")
+        return
+
+    include_report = verbose or output_path is not None
+
+    # The three analyses are independent, so run them in separate processes and
+    # display each one as soon as it finishes. "spawn" keeps workers free of any
+    # state inherited from the parent and behaves the same on every platform.
+    # A single Progress tracks all three runs.
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        console=console,
+        disable=not verbose,
+    ) as progress, ProcessPoolExecutor(
+        max_workers=3, mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        futures = {
+            executor.submit(_run_consistency, input_data, include_report): (
+                "Consistency",
+                _show_consistency,
+                report_file("consistency_report.json"),
+                progress.add_task("Testing consistency...", total=None),
+            ),
+            executor.submit(_run_performance, input_data, iterations, include_report): (
+                "Performance",
+                _show_performance,
+                report_file("performance_report.json"),
+                progress.add_task("Benchmarking providers...", total=None),
+            ),
+            executor.submit(_run_quality, input_data, include_report): (
+                "Quality",
+                _show_quality,
+                report_file("quality_report.json"),
+                progress.add_task("Analyzing quality...", total=None),
+            ),
+        }
+
+        for future in as_completed(futures):
+            name, show, output, task = futures[future]
+            progress.update(task, description=f"{name} complete", total=1, completed=1)
+            console.print(f"\n[cyan]{name} results:[/cyan]")
+            try:
+                show(*future.result(), output, verbose)
+            except Exception as e:
+                console.print(f"[red]{name} test failed: {e}[/red]")
 
     console.print("\n[green]✅ Comprehensive cross-provider analysis complete![/green]")
     if output_dir:
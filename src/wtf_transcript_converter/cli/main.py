@@ -5,49 +5,134 @@ This module provides the main CLI entry point for converting transcript formats
 and managing WTF documents.
 """
 
+import functools
 import json
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from importlib import import_module
 from pathlib import Path
-from typing import Any, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import click
+from pydantic import TypeAdapter
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.table import Table
 
+from ..core.models import WTFDocument
 from ..core.validator import validate_wtf_document
-from ..providers.assemblyai import AssemblyAIConverter
-from ..providers.base import BaseProviderConverter
-from ..providers.canary import CanaryConverter
-from ..providers.deepgram import DeepgramConverter
-from ..providers.parakeet import ParakeetConverter
-from ..providers.rev_ai import RevAIConverter
-from ..providers.whisper import WhisperConverter
+from ..utils.json_utils import dumps, load_file
 from .cross_provider import cross_provider
 
 console = Console()
 
+# Reusable validator/serializer for WTF documents
+_WTF_DOCUMENT_ADAPTER = TypeAdapter(WTFDocument)
+
+# Provider name -> (converter module, converter class). Modules are imported
+# on demand so that only the requested provider's dependencies are loaded.
+# TODO: Add other providers as they are implemented
+_PROVIDER_CONVERTERS: Dict[str, Tuple[str, str]] = {
+    "whisper": ("..providers.whisper", "WhisperConverter"),
+    "deepgram": ("..providers.deepgram", "DeepgramConverter"),
+    "assemblyai": ("..providers.assemblyai", "AssemblyAIConverter"),
+    "rev-ai": ("..providers.rev_ai", "RevAIConverter"),
+    "canary": ("..providers.canary", "CanaryConverter"),
+    "parakeet": ("..providers.parakeet", "ParakeetConverter"),
+}
+
+# (name, description, status) rows shown by the ``providers`` command
+_PROVIDERS_INFO: Tuple[Tuple[str, str, str], ...] = (
+    ("whisper", "OpenAI Whisper speech recognition", "Implemented"),
+    ("deepgram", "Deepgram real-time speech-to-text API", "Implemented"),
+    ("assemblyai", "AssemblyAI transcription service", "Implemented"),
+    ("rev-ai", "Rev.ai transcription service", "Implemented"),
+    ("canary", "NVIDIA Canary speech recognition via Hugging Face", "Implemented"),
+    ("parakeet", "NVIDIA Parakeet speech recognition via Hugging Face", "Implemented"),
+    ("google-cloud", "Google Cloud Speech-to-Text", "Planned"),
+    ("amazon-transcribe", "Amazon Transcribe service", "Planned"),
+    ("azure-speech", "Azure Speech Services", "Planned"),
+    ("speechmatics", "Speechmatics speech recognition", "Planned"),
+)
+
 
 def _get_converter(provider: str) -> Optional[Any]:
     """Get converter instance for the specified provider."""
-    provider = provider.lower()
-
-    if provider == "whisper":
-        return WhisperConverter()
-    elif provider == "deepgram":
-        return DeepgramConverter()
-    elif provider == "assemblyai":
-        return AssemblyAIConverter()
-    elif provider == "rev-ai":
-        return RevAIConverter()
-    elif provider == "canary":
-        return CanaryConverter()
-    elif provider == "parakeet":
-        return ParakeetConverter()
-    # TODO: Add other providers as they are implemented
+    entry = _PROVIDER_CONVERTERS.get(provider.lower())
+    if entry is None:
+        return None
+
+    module_name, class_name = entry
+    converter_class = getattr(import_module(module_name, __package__), class_name)
+    return converter_class()
+
+
+def _detect_provider(data: Any) -> Optional[str]:
+    """
+    Guess the provider of a transcript from its top-level fields.
+
+    Only top-level key lookups are performed on the already-parsed document,
+    which is then reused for conversion, so detection never parses twice.
+    """
+    if not isinstance(data, dict) or "transcript" in data:
+        return None
+    if "results" in data and "metadata" in data:
+        return "deepgram"
+    if "monologues" in data or "monologue" in data:
+        return "rev-ai"
+    if "audio_duration" in data:
+        return "assemblyai"
+
+    model = data.get("model")
+    if model:
+        model = str(model).lower()
+        if "canary" in model:
+            return "canary"
+        if "parakeet" in model:
+            return "parakeet"
+    if "segments" in data and "text" in data:
+        return "whisper"
 
     return None
 
 
+def _convert_file(input_file: str, output_file: str, provider: Optional[str]) -> Optional[str]:
+    """
+    Convert a single transcript file to WTF format.
+
+    This is the unit of work for batch conversion and runs in a worker process.
+
+    Args:
+        input_file: Path to the provider transcript
+        output_file: Path to write the WTF document to
+        provider: Provider name, or None to auto-detect
+
+    Returns:
+        Error message if the conversion failed, None otherwise
+    """
+    try:
+        input_data = load_file(input_file)
+
+        provider_name = provider or _detect_provider(input_data)
+        if provider_name is None:
+            return "Could not detect provider"
+
+        converter = _get_converter(provider_name)
+        if not converter:
+            return f"Unsupported provider '{provider_name}'"
+
+        wtf_doc = converter.convert_to_wtf(input_data)
+        is_valid, errors = validate_wtf_document(wtf_doc)
+        if not is_valid:
+            return f"Validation failed: {'; '.join(errors)}"
+
+        Path(output_file).write_bytes(_WTF_DOCUMENT_ADAPTER.dump_json(wtf_doc, indent=2))
+        return None
+    except Exception as e:
+        return str(e)
+
+
 @click.group()
 @click.version_option(version="0.1.0")
 def main() -> None:
@@ -85,8 +170,7 @@ def to_wtf(
 
     try:
         # Load input data
-        with open(input_file, "r", encoding="utf-8") as f:
-            input_data = json.load(f)
+        input_data = load_file(input_file)
 
         # Get converter based on provider
         converter = _get_converter(provider)
@@ -121,15 +205,15 @@ def to_wtf(
             output = str(input_path.with_suffix(".wtf.json"))
 
         # Save output
-        with open(output, "w", encoding="utf-8") as f:
-            json.dump(wtf_doc.model_dump(), f, indent=2, ensure_ascii=False)
+        Path(output).write_bytes(_WTF_DOCUMENT_ADAPTER.dump_json(wtf_doc, indent=2))
 
         console.print(f"[green]Successfully converted to WTF format: {output}[/green]")
         if verbose:
-            console.print(f"[blue]Transcript: {wtf_doc.transcript.text[:100]}...[/blue]")
-            console.print(f"[blue]Duration: {wtf_doc.transcript.duration}s[/blue]")
+            transcript = wtf_doc.transcript
+            console.print(f"[blue]Transcript: {transcript.text[:100]}...[/blue]")
+            console.print(f"[blue]Duration: {transcript.duration}s[/blue]")
             console.print(f"[blue]Segments: {len(wtf_doc.segments)}[/blue]")
-            console.print(f"[blue]Confidence: {wtf_doc.transcript.confidence:.2f}[/blue]")
+            console.print(f"[blue]Confidence: {transcript.confidence:.2f}[/blue]")
 
     except FileNotFoundError:
         console.print(f"[red]Error: Input file '{input_file}' not found[/red]")
@@ -165,13 +249,10 @@ def from_wtf(input_file: str, provider: str, output: Optional[str], verbose: boo
 
     try:
         # Load input data
-        with open(input_file, "r", encoding="utf-8") as f:
-            input_data = json.load(f)
+        input_data = load_file(input_file)
 
         # Validate input WTF document
-        from ..core.models import WTFDocument
-
-        wtf_doc = WTFDocument.model_validate(input_data)
+        wtf_doc = _WTF_DOCUMENT_ADAPTER.validate_python(input_data)
 
         # Get converter based on provider
         converter = _get_converter(provider)
@@ -197,8 +278,7 @@ def from_wtf(input_file: str, provider: str, output: Optional[str], verbose: boo
             output = str(input_path.with_suffix(f".{provider}.json"))
 
         # Save output
-        with open(output, "w", encoding="utf-8") as f:
-            json.dump(provider_data, f, indent=2, ensure_ascii=False)
+        Path(output).write_bytes(dumps(provider_data))
 
         console.print(f"[green]Successfully converted to {provider} format: {output}[/green]")
         if verbose:
@@ -239,7 +319,7 @@ def validate(input_file: str, verbose: bool) -> None:
     help="Input directory",
 )
 @click.option("--output-dir", "-o", type=click.Path(), required=True, help="Output directory")
-@click.option("--provider", "-p", help="Provider format (auto-detect if not specified)")
+@click.option("--provider", "-p", help="Provider format (default: auto-detect)")
 @click.option("--pattern", default="*.json", help="File pattern to match")
 @click.option("--verbose", "-v", is_flag=True, help="Verbose output")
 def batch(
@@ -252,6 +332,8 @@ def batch(
     """Batch convert multiple transcript files."""
     input_path = Path(input_dir)
     output_path = Path(output_dir)
+    if provider and provider.lower() == "auto":
+        provider = None
 
     if verbose:
         console.print(f"[blue]Batch converting files from {input_path} to {output_path}[/blue]")
@@ -261,39 +343,76 @@ def batch(
             console.print(f"[blue]Provider: auto-detect[/blue]")
         console.print(f"[blue]Pattern: {pattern}[/blue]")
 
-    # TODO: Implement batch conversion logic
-    console.print(f"[yellow]Batch conversion not yet implemented[/yellow]")
-
-
-@main.command()
-def providers() -> None:
-    """List supported transcription providers."""
+    if provider and provider.lower() not in _PROVIDER_CONVERTERS:
+        console.print(f"[red]Error: Unsupported provider '{provider}'[/red]")
+        console.print("Use 'vcon-wtf providers' to see supported providers")
+        return
+
+    files = sorted(p for p in input_path.glob(pattern) if p.is_file())
+    if not files:
+        console.print(f"[yellow]No files matching '{pattern}' in {input_path}[/yellow]")
+        return
+
+    output_path.mkdir(parents=True, exist_ok=True)
+
+    # Each file is converted independently, so fan the work out across
+    # processes. "spawn" gives every worker a clean interpreter that only
+    # imports the providers it actually needs.
+    failures: List[Tuple[Path, str]] = []
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        console=console,
+        disable=not verbose,
+    ) as progress:
+        task = progress.add_task(f"Converting 0/{len(files)}...", total=len(files))
+        with ProcessPoolExecutor(
+            max_workers=min(len(files), os.cpu_count() or 1),
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as executor:
+            futures = {
+                executor.submit(
+                    _convert_file,
+                    str(file),
+                    str(output_path / file.with_suffix(".wtf.json").name),
+                    provider,
+                ): file
+                for file in files
+            }
+            for done, future in enumerate(as_completed(futures), start=1):
+                error = future.result()
+                if error:
+                    failures.append((futures[future], error))
+                progress.update(
+                    task, advance=1, description=f"Converting {done}/{len(files)}..."
+                )
+
+    for file, error in failures:
+        console.print(f"[red]Failed to convert {file}: {error}[/red]")
+    console.print(
+        f"[green]Batch conversion complete: {len(files) - len(failures)} succeeded, "
+        f"{len(failures)} failed[/green]"
+    )
+
+
+@functools.cache
+def _providers_table() -> Table:
+    """Build the table of supported providers once and reuse it."""
     table = Table(title="Supported Transcription Providers")
     table.add_column("Provider", style="cyan")
     table.add_column("Description", style="magenta")
     table.add_column("Status", style="green")
 
-    providers_data = [
-        ("whisper", "OpenAI Whisper speech recognition", "Implemented"),
-        ("deepgram", "Deepgram real-time speech-to-text API", "Implemented"),
-        ("assemblyai", "AssemblyAI transcription service", "Implemented"),
-        ("rev-ai", "Rev.ai transcription service", "Implemented"),
-        ("canary", "NVIDIA Canary speech recognition via Hugging Face", "Implemented"),
-        (
-            "parakeet",
-            "NVIDIA Parakeet speech recognition via Hugging Face",
-            "Implemented",
-        ),
-        ("google-cloud", "Google Cloud Speech-to-Text", "Planned"),
-        ("amazon-transcribe", "Amazon Transcribe service", "Planned"),
-        ("azure-speech", "Azure Speech Services", "Planned"),
-        ("speechmatics", "Speechmatics speech recognition", "Planned"),
-    ]
-
-    for provider, description, status in providers_data:
+    for provider, description, status in _PROVIDERS_INFO:
         table.add_row(provider, description, status)
 
-    console.print(table)
+    return table
+
+
+@main.command()
+def providers() -> None:
+    """List supported transcription providers."""
+    console.print(_providers_table())
 
 
 # Add cross-provider commands to main CLI
@@ -18,7 +18,7 @@ from .models import (
     WTFTranscript,
     WTFWord,
 )
-from .validator import validate_wtf_document
+from .validator import validate_wtf_document, validate_wtf_document_iter
 
 __all__ = [
     "WTFDocument",
@@ -32,6 +32,7 @@ __all__ = [
     "WTFExtensions",
     "VConWTFAttachment",
     "validate_wtf_document",
+    "validate_wtf_document_iter",
     "BaseConverter",
     "ToWTFConverter",
     "FromWTFConverter",
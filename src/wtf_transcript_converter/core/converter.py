@@ -14,7 +14,13 @@ T = TypeVar("T")
 
 
 class BaseConverter(ABC):
-    """Abstract base class for all converters."""
+    """Abstract base class for all converters.
+
+    Declares empty ``__slots__`` so that subclasses which also declare
+    ``__slots__`` do not carry a per-instance ``__dict__``.
+    """
+
+    __slots__ = ()
 
     @abstractmethod
     def convert(self, data: Any) -> Any:
@@ -23,7 +29,12 @@ class BaseConverter(ABC):
 
 
 class ToWTFConverter(BaseConverter):
-    """Abstract base class for converters that convert TO WTF format."""
+    """Abstract base class for converters that convert TO WTF format.
+
+    Subclasses must declare ``__slots__`` to benefit from the slotted base.
+    """
+
+    __slots__ = ()
 
     @abstractmethod
     def convert(self, data: Dict[str, Any]) -> WTFDocument:
@@ -32,7 +43,12 @@ class ToWTFConverter(BaseConverter):
 
 
 class FromWTFConverter(BaseConverter):
-    """Abstract base class for converters that convert FROM WTF format."""
+    """Abstract base class for converters that convert FROM WTF format.
+
+    Subclasses must declare ``__slots__`` to benefit from the slotted base.
+    """
+
+    __slots__ = ()
 
     @abstractmethod
     def convert(self, wtf_doc: WTFDocument) -> Dict[str, Any]:
@@ -2,6 +2,11 @@
 Core WTF data models.
 
 This module contains Pydantic models for the World Transcription Format (WTF).
+
+Nested component models (words, speakers, audio, quality) are public API and
+are used through attribute access by converters and validators, so they stay
+BaseModel subclasses. WTFSpeaker, WTFAudio and WTFQuality only declare field
+constraints, which pydantic-core enforces without calling back into Python.
 """
 
 import re
@@ -10,6 +15,11 @@ from typing import Any, Dict, List, Optional, Union
 
 from pydantic import BaseModel, Field, field_validator, model_validator
 
+# Basic BCP-47 validation pattern, matched against the lowercased code
+_BCP47_RE = re.compile(
+    r"^[a-z]{2,3}(-[A-Z]{2})?(-[a-z0-9]{5,8})?(-[a-z0-9]{1,8})*(-[a-z0-9]{1,8})*$"
+)
+
 
 class WTFTranscript(BaseModel):
     """Core transcript information following WTF specification."""
@@ -25,11 +35,10 @@ class WTFTranscript(BaseModel):
     @classmethod
     def validate_language_code(cls, v: str) -> str:
         """Validate BCP-47 language code format."""
-        # Basic BCP-47 validation pattern
-        pattern = r"^[a-z]{2,3}(-[A-Z]{2})?(-[a-z0-9]{5,8})?(-[a-z0-9]{1,8})*(-[a-z0-9]{1,8})*$"
-        if not re.match(pattern, v.lower()):
+        lowered = v.lower()
+        if not _BCP47_RE.match(lowered):
             raise ValueError(f"Invalid BCP-47 language code: {v}")
-        return v.lower()
+        return lowered
 
     @field_validator("text")
     @classmethod
@@ -138,7 +147,8 @@ class WTFMetadata(BaseModel):
     def validate_timestamp(cls, v: str) -> str:
         """Validate ISO 8601 timestamp format."""
         try:
-            datetime.fromisoformat(v.replace("Z", "+00:00"))
+            # Python 3.11+ parses the "Z" UTC designator natively
+            datetime.fromisoformat(v)
         except ValueError:
             raise ValueError(f"Invalid ISO 8601 timestamp: {v}")
         return v
@@ -206,13 +216,12 @@ class WTFDocument(BaseModel):
 
     @model_validator(mode="after")
     def validate_document_consistency(self) -> "WTFDocument":
-        """Validate document-level consistency."""
-        # Check that segments are properly ordered
-        if len(self.segments) > 1:
-            for i in range(1, len(self.segments)):
-                if self.segments[i].start < self.segments[i - 1].end:
-                    raise ValueError(f"Segments {i-1} and {i} have overlapping times")
+        """
+        Validate document-level consistency.
 
+        Segment ordering and timing are reported by validate_wtf_document rather
+        than rejected here.
+        """
         # Check that words reference valid segments if provided
         if self.words and self.segments:
             segment_ids = {seg.id for seg in self.segments}
@@ -224,13 +233,14 @@ class WTFDocument(BaseModel):
 
         # Check that speaker references are valid
         if self.speakers and self.segments:
-            speaker_ids = set(self.speakers.keys())
+            speaker_ids = frozenset(self.speakers)
             for segment in self.segments:
-                if segment.speaker is not None:
-                    speaker_key = str(segment.speaker)
+                speaker = segment.speaker
+                if speaker is not None:
+                    speaker_key = speaker if type(speaker) is str else str(speaker)
                     if speaker_key not in speaker_ids:
                         raise ValueError(
-                            f"Segment {segment.id} references invalid speaker {segment.speaker}"
+                            f"Segment {segment.id} references invalid speaker {speaker}"
                         )
 
         return self
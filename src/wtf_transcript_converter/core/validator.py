@@ -4,178 +4,147 @@ WTF document validation functions.
 This module provides validation functions for WTF documents and their components.
 """
 
-import re
-from typing import List, Tuple
+from datetime import datetime
+from itertools import islice
+from typing import Iterator, List, Tuple
 
-from .models import WTFDocument
+from .models import _BCP47_RE, WTFDocument
 
 
-def validate_wtf_document(doc: WTFDocument) -> Tuple[bool, List[str]]:
+def validate_wtf_document(doc: WTFDocument, max_errors: int = 100) -> Tuple[bool, List[str]]:
     """
     Validate a WTF document for compliance with the specification.
 
+    Validation stops once ``max_errors`` errors have been found.
+
     Args:
         doc: WTF document to validate
+        max_errors: Maximum number of errors to collect; must be at least 1
 
     Returns:
         Tuple of (is_valid, list_of_errors)
-    """
-    errors = []
-
-    # Basic validation - Pydantic already handles most of this
-    try:
-        # Check if document can be serialized
-        doc.model_dump()
-    except Exception as e:
-        errors.append(f"Document serialization error: {str(e)}")
-
-    # Additional custom validations
-    errors.extend(_validate_transcript_consistency(doc))
-    errors.extend(_validate_timing_consistency(doc))
-    errors.extend(_validate_speaker_consistency(doc))
-    errors.extend(_validate_word_segment_consistency(doc))
-    errors.extend(_validate_confidence_scores(doc))
-
-    return len(errors) == 0, errors
-
-
-def _validate_transcript_consistency(doc: WTFDocument) -> List[str]:
-    """Validate transcript text consistency with segments."""
-    errors = []
-
-    # Check that transcript text matches concatenated segment text
-    segment_text = " ".join(seg.text for seg in doc.segments)
-    if doc.transcript.text.strip() != segment_text.strip():
-        errors.append("Transcript text does not match concatenated segment text")
-
-    # Check that transcript duration matches segment timing (with more tolerance for Deepgram)
-    if doc.segments:
-        max_end_time = max(seg.end for seg in doc.segments)
-        # Allow up to 5 seconds tolerance for providers like Deepgram that may have silence at the end
-        if abs(doc.transcript.duration - max_end_time) > 5.0:
-            errors.append(
-                f"Transcript duration ({doc.transcript.duration}) does not match segment timing ({max_end_time})"
-            )
-
-    return errors
-
-
-def _validate_timing_consistency(doc: WTFDocument) -> List[str]:
-    """Validate timing consistency across the document."""
-    errors = []
-
-    # Check segment timing
-    for i, segment in enumerate(doc.segments):
-        if segment.start >= segment.end:
-            errors.append(
-                f"Segment {i}: start time ({segment.start}) must be before end time ({segment.end})"
-            )
-
-    # Check for overlapping segments
-    for i in range(len(doc.segments) - 1):
-        if doc.segments[i].end > doc.segments[i + 1].start:
-            errors.append(f"Segments {i} and {i + 1} have overlapping times")
-
-    # Check word timing if available
-    if doc.words:
-        for word in doc.words:
-            if word.start >= word.end:
-                errors.append(
-                    f"Word {word.id}: start time ({word.start}) must be before end time ({word.end})"
-                )
-
-    return errors
-
 
-def _validate_speaker_consistency(doc: WTFDocument) -> List[str]:
-    """Validate speaker consistency across the document."""
-    errors: List[str] = []
+    Raises:
+        ValueError: If max_errors is less than 1
+    """
+    if max_errors < 1:
+        raise ValueError(f"max_errors must be at least 1, got {max_errors}")
 
-    if not doc.speakers or not doc.segments:
-        return errors
+    errors = list(islice(validate_wtf_document_iter(doc), max_errors))
+    return not errors, errors
 
-    # Get all speaker IDs from speakers dict
-    speaker_ids = set(doc.speakers.keys())
 
-    # Check that all segment speakers are valid
-    for segment in doc.segments:
-        if segment.speaker is not None:
-            speaker_key = str(segment.speaker)
-            if speaker_key not in speaker_ids:
-                errors.append(f"Segment {segment.id} references invalid speaker {segment.speaker}")
+def validate_wtf_document_iter(doc: WTFDocument) -> Iterator[str]:
+    """
+    Lazily yield validation errors for a WTF document.
 
-    # Check that all word speakers are valid
-    if doc.words:
-        for word in doc.words:
-            if word.speaker is not None:
-                speaker_key = str(word.speaker)
-                if speaker_key not in speaker_ids:
-                    errors.append(f"Word {word.id} references invalid speaker {word.speaker}")
+    Transcript, segment, word and speaker checks are made in a single pass over
+    each collection, and work stops as soon as the caller stops iterating, so
+    ``any(validate_wtf_document_iter(doc))`` returns on the first error.
 
-    return errors
+    Args:
+        doc: WTF document to validate
 
+    Yields:
+        Validation error messages
+    """
+    # Field-level validation is done by Pydantic when the document is built;
+    # these are the cross-field consistency checks
+    transcript = doc.transcript
+    segments = doc.segments
+    words = doc.words
+    speakers = doc.speakers
+    speaker_ids = frozenset(speakers) if speakers else None
+    # Word lookup for segment references; the first word wins on duplicate IDs
+    word_map = {word.id: word for word in reversed(words)} if words else None
 
-def _validate_word_segment_consistency(doc: WTFDocument) -> List[str]:
-    """Validate word-segment consistency."""
-    errors: List[str] = []
+    # Check transcript confidence
+    if not (0.0 <= transcript.confidence <= 1.0):
+        yield f"Transcript confidence ({transcript.confidence}) must be between 0.0 and 1.0"
+
+    # Segment checks: timing, ordering, confidence, speakers and word references
+    segment_texts: List[str] = []
+    prev_end = None
+    max_end_time = 0.0
+    for i, segment in enumerate(segments):
+        seg_id = segment.id
+        seg_start = segment.start
+        seg_end = segment.end
+        segment_texts.append(segment.text)
+        if i == 0 or seg_end > max_end_time:
+            max_end_time = seg_end
+
+        if seg_start >= seg_end:
+            yield f"Segment {i}: start time ({seg_start}) must be before end time ({seg_end})"
+        if prev_end is not None and prev_end > seg_start:
+            yield f"Segments {i - 1} and {i} have overlapping times"
+        prev_end = seg_end
 
-    if not doc.words or not doc.segments:
-        return errors
+        if not (0.0 <= segment.confidence <= 1.0):
+            yield f"Segment {seg_id} confidence ({segment.confidence}) must be between 0.0 and 1.0"
 
-    # Create mapping of segment IDs to segments
-    segment_map = {seg.id: seg for seg in doc.segments}
+        speaker = segment.speaker
+        if speaker_ids is not None and speaker is not None:
+            if (speaker if type(speaker) is str else str(speaker)) not in speaker_ids:
+                yield f"Segment {seg_id} references invalid speaker {speaker}"
 
-    # Check that all word references in segments are valid
-    for segment in doc.segments:
-        if segment.words:
+        if word_map is not None and segment.words:
             for word_id in segment.words:
-                word = next((w for w in doc.words if w.id == word_id), None)
+                word = word_map.get(word_id)
                 if word is None:
-                    errors.append(f"Segment {segment.id} references invalid word {word_id}")
-                else:
-                    # Check that word timing is within segment timing
-                    if word.start < segment.start or word.end > segment.end:
-                        errors.append(
-                            f"Word {word_id} timing is outside segment {segment.id} timing"
-                        )
-
-    return errors
-
-
-def _validate_confidence_scores(doc: WTFDocument) -> List[str]:
-    """Validate confidence scores are in valid range."""
-    errors = []
+                    yield f"Segment {seg_id} references invalid word {word_id}"
+                elif word.start < seg_start or word.end > seg_end:
+                    # Word timing must be within segment timing
+                    yield f"Word {word_id} timing is outside segment {seg_id} timing"
 
-    # Check transcript confidence
-    if not (0.0 <= doc.transcript.confidence <= 1.0):
-        errors.append(
-            f"Transcript confidence ({doc.transcript.confidence}) must be between 0.0 and 1.0"
-        )
-
-    # Check segment confidence scores
-    for segment in doc.segments:
-        if not (0.0 <= segment.confidence <= 1.0):
-            errors.append(
-                f"Segment {segment.id} confidence ({segment.confidence}) must be between 0.0 and 1.0"
-            )
+    # Check that transcript text matches concatenated segment text
+    if not _text_matches_segments(transcript.text.strip(), segment_texts):
+        yield "Transcript text does not match concatenated segment text"
 
-    # Check word confidence scores
-    if doc.words:
-        for word in doc.words:
+    # Check that transcript duration matches segment timing (with more tolerance for Deepgram)
+    if segments:
+        # Allow up to 5 seconds tolerance for providers like Deepgram that may have silence at the end
+        if abs(transcript.duration - max_end_time) > 5.0:
+            yield f"Transcript duration ({transcript.duration}) does not match segment timing ({max_end_time})"
+
+    # Word checks: timing, speakers and confidence
+    if words:
+        # Word speakers are only checked against documents with segments
+        word_speaker_ids = speaker_ids if segments else None
+        for word in words:
+            word_start = word.start
+            word_end = word.end
+            if word_start >= word_end:
+                yield f"Word {word.id}: start time ({word_start}) must be before end time ({word_end})"
+            speaker = word.speaker
+            if word_speaker_ids is not None and speaker is not None:
+                if (speaker if type(speaker) is str else str(speaker)) not in word_speaker_ids:
+                    yield f"Word {word.id} references invalid speaker {speaker}"
             if not (0.0 <= word.confidence <= 1.0):
-                errors.append(
-                    f"Word {word.id} confidence ({word.confidence}) must be between 0.0 and 1.0"
-                )
+                yield f"Word {word.id} confidence ({word.confidence}) must be between 0.0 and 1.0"
 
     # Check speaker confidence scores
-    if doc.speakers:
-        for speaker in doc.speakers.values():
+    if speakers:
+        for speaker in speakers.values():
             if not (0.0 <= speaker.confidence <= 1.0):
-                errors.append(
-                    f"Speaker {speaker.id} confidence ({speaker.confidence}) must be between 0.0 and 1.0"
-                )
+                yield f"Speaker {speaker.id} confidence ({speaker.confidence}) must be between 0.0 and 1.0"
+
+
+def _text_matches_segments(text: str, segment_texts: List[str]) -> bool:
+    """Compare stripped transcript text with the space-joined segment texts."""
+    if not segment_texts:
+        return text == ""
 
-    return errors
+    # Validated segment text is already stripped, in which case the joined text
+    # needs no stripping and a length mismatch decides without building it
+    first = segment_texts[0]
+    last = segment_texts[-1]
+    if first and last and not first[0].isspace() and not last[-1].isspace():
+        joined_length = sum(map(len, segment_texts)) + len(segment_texts) - 1
+        if len(text) != joined_length:
+            return False
+
+    return text == " ".join(segment_texts).strip()
 
 
 def validate_confidence_score(confidence: float, context: str = "") -> bool:
@@ -203,9 +172,7 @@ def validate_timestamp(timestamp: str) -> bool:
         True if valid, False otherwise
     """
     try:
-        from datetime import datetime
-
-        datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+        datetime.fromisoformat(timestamp)
         return True
     except ValueError:
         return False
@@ -221,5 +188,4 @@ def validate_language_code(language_code: str) -> bool:
     Returns:
         True if valid, False otherwise
     """
-    pattern = r"^[a-z]{2,3}(-[A-Z]{2})?(-[a-z0-9]{5,8})?(-[a-z0-9]{1,8})*(-[a-z0-9]{1,8})*$"
-    return bool(re.match(pattern, language_code.lower()))
+    return bool(_BCP47_RE.match(language_code.lower()))
@@ -5,19 +5,20 @@ This module tests the same audio content across multiple providers to ensure
 WTF format consistency and validate standardization.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Sequence, Union
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
 from wtf_transcript_converter.core.models import WTFDocument
 from wtf_transcript_converter.core.validator import validate_wtf_document
-from wtf_transcript_converter.providers import (
-    AssemblyAIConverter,
-    CanaryConverter,
-    DeepgramConverter,
-    ParakeetConverter,
-    RevAIConverter,
-    WhisperConverter,
-)
+from wtf_transcript_converter.cross_provider.registry import LazyProviderMap
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
 
 
 @dataclass
@@ -39,72 +40,75 @@ class CrossProviderConsistencyTester:
     """Test consistency across multiple transcription providers."""
 
     def __init__(self) -> None:
-        self.providers = {
-            "whisper": WhisperConverter(),
-            "deepgram": DeepgramConverter(),
-            "assemblyai": AssemblyAIConverter(),
-            "rev-ai": RevAIConverter(),
-            "canary": CanaryConverter(),
-            "parakeet": ParakeetConverter(),
-        }
+        # Converters are imported and instantiated on first use
+        self.providers = LazyProviderMap()
 
     def test_consistency_with_sample_data(
-        self, sample_data: Dict[str, Any]
+        self, sample_data: Dict[str, Any], max_workers: Optional[int] = None
     ) -> List[ConsistencyResult]:
         """
         Test consistency across providers using sample JSON data.
 
         Args:
             sample_data: Sample transcription data in provider format
+            max_workers: Convert with this many threads; providers run
+                sequentially when None. Only useful for converters that do I/O
+                or release the GIL.
 
         Returns:
-            List of consistency results for each provider
+            List of consistency results for each provider, in provider order
         """
-        results = []
-
-        for provider_name, converter in self.providers.items():
-            try:
-                # Convert to WTF
-                wtf_doc = converter.convert(sample_data)
-
-                # Validate WTF document
-                is_valid, validation_errors = validate_wtf_document(wtf_doc)
-
-                # Calculate metrics
-                confidence_score = wtf_doc.transcript.confidence
-                word_count = len(wtf_doc.words) if wtf_doc.words else 0
-                segment_count = len(wtf_doc.segments)
-                duration = wtf_doc.transcript.duration
-
-                result = ConsistencyResult(
-                    provider=provider_name,
-                    wtf_doc=wtf_doc,
-                    is_valid=is_valid,
-                    validation_errors=validation_errors,
-                    processing_time=0.0,  # Not measured for sample data
-                    confidence_score=confidence_score,
-                    word_count=word_count,
-                    segment_count=segment_count,
-                    duration=duration,
-                )
-                results.append(result)
-
-            except Exception as e:
-                # Create error result
-                result = ConsistencyResult(
-                    provider=provider_name,
-                    wtf_doc=None,
-                    is_valid=False,
-                    validation_errors=[f"Conversion failed: {str(e)}"],
-                    processing_time=0.0,
-                    confidence_score=0.0,
-                    word_count=0,
-                    segment_count=0,
-                    duration=0.0,
-                )
-                results.append(result)
-
-        return results
+        if max_workers is None:
+            return [
+                self._test_provider(provider_name, converter, sample_data)
+                for provider_name, converter in self.providers.items()
+            ]
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(self._test_provider, provider_name, converter, sample_data)
+                for provider_name, converter in self.providers.items()
+            ]
+            return [future.result() for future in futures]
+
+    def _test_provider(
+        self, provider_name: str, converter: Any, sample_data: Dict[str, Any]
+    ) -> ConsistencyResult:
+        """Convert and validate the sample data with a single provider."""
+        try:
+            # Convert to WTF
+            wtf_doc = converter.convert(sample_data)
+
+            # Validate WTF document. Model construction in the converter is not
+            # redundant with this: it normalizes fields and enforces the field
+            # constraints, while this checks cross-field consistency.
+            is_valid, validation_errors = validate_wtf_document(wtf_doc)
+
+            return ConsistencyResult(
+                provider=provider_name,
+                wtf_doc=wtf_doc,
+                is_valid=is_valid,
+                validation_errors=validation_errors,
+                processing_time=0.0,  # Not measured for sample data
+                confidence_score=wtf_doc.transcript.confidence,
+                word_count=len(wtf_doc.words) if wtf_doc.words else 0,
+                segment_count=len(wtf_doc.segments),
+                duration=wtf_doc.transcript.duration,
+            )
+
+        except Exception as e:
+            # Create error result
+            return ConsistencyResult(
+                provider=provider_name,
+                wtf_doc=None,
+                is_valid=False,
+                validation_errors=[f"Conversion failed: {str(e)}"],
+                processing_time=0.0,
+                confidence_score=0.0,
+                word_count=0,
+                segment_count=0,
+                duration=0.0,
+            )
 
     def analyze_consistency(self, results: List[ConsistencyResult]) -> Dict[str, Any]:
         """
@@ -133,10 +137,10 @@ class CrossProviderConsistencyTester:
         durations = [r.duration for r in valid_results]
 
         # Calculate consistency metrics
-        confidence_std = self._calculate_std(confidences)
-        word_count_std = self._calculate_std(word_counts)
-        segment_count_std = self._calculate_std(segment_counts)
-        duration_std = self._calculate_std(durations)
+        confidence_mean, confidence_std = self._calculate_mean_std(confidences)
+        word_count_mean, word_count_std = self._calculate_mean_std(word_counts)
+        segment_count_mean, segment_count_std = self._calculate_mean_std(segment_counts)
+        duration_mean, duration_std = self._calculate_mean_std(durations)
 
         # Check for significant differences
         confidence_consistent = confidence_std < 0.1  # Less than 10% standard deviation
@@ -159,25 +163,25 @@ class CrossProviderConsistencyTester:
             "valid_providers": len(valid_results),
             "metrics": {
                 "confidence": {
-                    "mean": sum(confidences) / len(confidences),
+                    "mean": confidence_mean,
                     "std": confidence_std,
                     "consistent": confidence_consistent,
                     "values": confidences,
                 },
                 "word_count": {
-                    "mean": sum(word_counts) / len(word_counts),
+                    "mean": word_count_mean,
                     "std": word_count_std,
                     "consistent": word_count_consistent,
                     "values": word_counts,
                 },
                 "segment_count": {
-                    "mean": sum(segment_counts) / len(segment_counts),
+                    "mean": segment_count_mean,
                     "std": segment_count_std,
                     "consistent": segment_count_consistent,
                     "values": segment_counts,
                 },
                 "duration": {
-                    "mean": sum(durations) / len(durations),
+                    "mean": duration_mean,
                     "std": duration_std,
                     "consistent": duration_consistent,
                     "values": durations,
@@ -198,13 +202,25 @@ class CrossProviderConsistencyTester:
 
     def _calculate_std(self, values: Sequence[Union[int, float]]) -> float:
         """Calculate standard deviation."""
-        if len(values) <= 1:
-            return 0.0
+        return self._calculate_mean_std(values)[1]
+
+    def _calculate_mean_std(self, values: Sequence[Union[int, float]]) -> Tuple[float, float]:
+        """Calculate the mean and sample standard deviation in one go."""
+        if not values:
+            return 0.0, 0.0
+
+        if NUMPY_AVAILABLE:
+            array = np.asarray(values, dtype=np.float64)
+            mean = float(array.mean())
+            std = float(array.std(ddof=1)) if array.size > 1 else 0.0
+            return mean, std
 
         float_values = [float(x) for x in values]
         mean = sum(float_values) / len(float_values)
+        if len(float_values) <= 1:
+            return mean, 0.0
         variance = sum((x - mean) ** 2 for x in float_values) / (len(float_values) - 1)
-        return float(variance**0.5)
+        return mean, float(variance**0.5)
 
     def generate_consistency_report(self, results: List[ConsistencyResult]) -> str:
         """Generate a human-readable consistency report."""
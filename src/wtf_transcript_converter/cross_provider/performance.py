@@ -5,27 +5,48 @@ This module benchmarks the performance of different providers to measure
 conversion speed, memory usage, and other performance metrics.
 """
 
+import io
+import multiprocessing
 import os
+import pickle
+import statistics
 import time
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
-from typing import Any, Dict, List
+from typing import Any, BinaryIO, Dict, List, Optional
 
 import psutil
 import pytest
+from pydantic import TypeAdapter
 
-from wtf_transcript_converter.providers import (
-    AssemblyAIConverter,
-    CanaryConverter,
-    DeepgramConverter,
-    ParakeetConverter,
-    RevAIConverter,
-    WhisperConverter,
-)
+from wtf_transcript_converter.core.models import WTFDocument
+from wtf_transcript_converter.cross_provider.registry import LazyProviderMap
 
+# Serializes documents straight to UTF-8 bytes for size measurement. This runs
+# in pydantic-core, so it beats orjson.dumps(doc.model_dump()), which has to
+# build the intermediate dicts first.
+_WTF_DOCUMENT_ADAPTER = TypeAdapter(WTFDocument)
 
-@dataclass
+# Bound formatters for the report's numeric columns
+_FMT_TIME = "{:.3f}s".format
+_FMT_MB = "{:.2f}MB".format
+_FMT_KB = "{:.2f}KB".format
+_FMT_PERCENT = "{:.1f}%".format
+
+
+# CPU times advance in scheduler ticks, so utilization over a shorter
+# window is noise rather than a measurement
+_MIN_CPU_WINDOW_NS = 100_000_000
+
+
+@dataclass(slots=True, frozen=True)
 class PerformanceMetrics:
-    """Performance metrics for a provider."""
+    """
+    Performance metrics for a provider.
+
+    cpu_usage_percent is 0.0 when the measured loop ran for less than 100ms,
+    which is too short for a meaningful utilization figure.
+    """
 
     provider: str
     conversion_time: float
@@ -36,21 +57,40 @@ class PerformanceMetrics:
     error_message: str = ""
 
 
+# Serializes metrics as single-line JSON for streamed results
+_PERFORMANCE_METRICS_ADAPTER = TypeAdapter(PerformanceMetrics)
+
+
+def _write_result(stream: Optional[BinaryIO], metrics: PerformanceMetrics) -> None:
+    """Write one result as a JSON line and flush it, if streaming is enabled."""
+    if stream is not None:
+        stream.write(_PERFORMANCE_METRICS_ADAPTER.dump_json(metrics) + b"\n")
+        stream.flush()
+
+
+def _run_one(provider_name: str, sample_payload: bytes, iterations: int) -> "PerformanceMetrics":
+    """Benchmark one provider in a worker process with its own process handle."""
+    sample_data = pickle.loads(sample_payload)
+    return PerformanceBenchmark().benchmark_provider(provider_name, sample_data, iterations)
+
+
 class PerformanceBenchmark:
     """Benchmark performance across multiple providers."""
 
     def __init__(self) -> None:
-        self.providers = {
-            "whisper": WhisperConverter(),
-            "deepgram": DeepgramConverter(),
-            "assemblyai": AssemblyAIConverter(),
-            "rev-ai": RevAIConverter(),
-            "canary": CanaryConverter(),
-            "parakeet": ParakeetConverter(),
-        }
+        # Converters are imported and instantiated on first benchmark
+        self.providers = LazyProviderMap()
+        # Reuse one process handle for every measurement and prime its CPU
+        # baseline so later non-blocking cpu_percent() reads are meaningful
+        self._process = psutil.Process(os.getpid())
+        self._process.cpu_percent(interval=None)
 
     def benchmark_provider(
-        self, provider_name: str, sample_data: Dict[str, Any], iterations: int = 3
+        self,
+        provider_name: str,
+        sample_data: Dict[str, Any],
+        iterations: int = 3,
+        time_budget: Optional[float] = 2.0,
     ) -> PerformanceMetrics:
         """
         Benchmark a single provider.
@@ -58,87 +98,107 @@ class PerformanceBenchmark:
         Args:
             provider_name: Name of the provider
             sample_data: Sample data to convert
-            iterations: Number of iterations to average
+            iterations: Number of measured iterations, after one untimed
+                warm-up run. The conversion time is the median when there are
+                at least three iterations and the mean otherwise.
+            time_budget: Stop early, after at least one iteration, once the
+                measured conversions have taken this many seconds in total.
+                None always runs every iteration.
 
         Returns:
             Performance metrics
         """
         if provider_name not in self.providers:
-            return PerformanceMetrics(
-                provider=provider_name,
-                conversion_time=0.0,
-                memory_usage_mb=0.0,
-                cpu_usage_percent=0.0,
-                wtf_doc_size_kb=0.0,
-                success=False,
-                error_message=f"Provider {provider_name} not found",
-            )
-
-        converter = self.providers[provider_name]
-        times = []
-        memory_usages = []
-        cpu_usages = []
-        wtf_doc_sizes = []
-
-        for i in range(iterations):
-            try:
-                # Measure memory before
-                process = psutil.Process(os.getpid())
-                memory_before = process.memory_info().rss / 1024 / 1024  # MB
-                cpu_before = process.cpu_percent()
-
-                # Time the conversion
-                start_time = time.time()
+            return self._fail(provider_name, f"Provider {provider_name} not found")
+
+        try:
+            converter = self.providers[provider_name]
+        except Exception as e:
+            # The converter could not be created; report it without running
+            return self._fail(provider_name, f"Failed to initialize {provider_name}: {e}")
+
+        times_ns = []
+        total_ns = 0
+        budget_ns = None if time_budget is None else time_budget * 1e9
+        process = self._process
+
+        try:
+            # Untimed warm-up run so first-call costs (lazy imports, cold
+            # caches) are not part of the measurement
+            converter.convert(sample_data)
+
+            # Sample memory and CPU once around the measured loop rather than
+            # per iteration, so each timed region contains only the conversion
+            memory_before = process.memory_info().rss / 1024 / 1024  # MB
+            process.cpu_percent()  # Start the CPU utilization window
+            window_start_ns = time.perf_counter_ns()
+
+            for _ in range(iterations):
+                # Time the conversion with the monotonic high-resolution clock
+                start_ns = time.perf_counter_ns()
                 # Convert using the convert method (ToWTFConverter interface)
                 wtf_doc = converter.convert(sample_data)
-                end_time = time.time()
-
-                # Measure memory after
-                memory_after = process.memory_info().rss / 1024 / 1024  # MB
-                cpu_after = process.cpu_percent()
-
-                # Calculate metrics
-                conversion_time = end_time - start_time
-                memory_usage = memory_after - memory_before
-                cpu_usage = cpu_after - cpu_before
-
-                # Calculate WTF document size
-                wtf_doc_json = wtf_doc.model_dump_json()
-                wtf_doc_size = len(wtf_doc_json.encode("utf-8")) / 1024  # KB
-
-                times.append(conversion_time)
-                memory_usages.append(memory_usage)
-                cpu_usages.append(cpu_usage)
-                wtf_doc_sizes.append(wtf_doc_size)
-
-            except Exception as e:
-                return PerformanceMetrics(
-                    provider=provider_name,
-                    conversion_time=0.0,
-                    memory_usage_mb=0.0,
-                    cpu_usage_percent=0.0,
-                    wtf_doc_size_kb=0.0,
-                    success=False,
-                    error_message=str(e),
-                )
-
-        # Calculate averages
-        avg_time = sum(times) / len(times)
-        avg_memory = sum(memory_usages) / len(memory_usages)
-        avg_cpu = sum(cpu_usages) / len(cpu_usages)
-        avg_size = sum(wtf_doc_sizes) / len(wtf_doc_sizes)
+                end_ns = time.perf_counter_ns()
+
+                times_ns.append(end_ns - start_ns)
+                total_ns += end_ns - start_ns
+                if budget_ns is not None and total_ns > budget_ns:
+                    break
+
+        except Exception as e:
+            return self._fail(provider_name, str(e))
+
+        # Converters convert WTF-format samples back to their own format
+        if not isinstance(wtf_doc, WTFDocument):
+            return self._fail(
+                provider_name, f"Converter returned {type(wtf_doc).__name__}, not a WTFDocument"
+            )
+
+        memory_after = process.memory_info().rss / 1024 / 1024  # MB
+        if time.perf_counter_ns() - window_start_ns >= _MIN_CPU_WINDOW_NS:
+            cpu_usage = process.cpu_percent()  # Utilization since the window started
+        else:
+            cpu_usage = 0.0
+
+        # The output is deterministic for the same input, so size the last
+        # document once, outside the measured loop
+        wtf_doc_size = len(_WTF_DOCUMENT_ADAPTER.dump_json(wtf_doc)) / 1024  # KB
+
+        # Calculate averages; the median discards a single outlier run
+        if len(times_ns) >= 3:
+            avg_time = statistics.median(times_ns) / 1e9
+        else:
+            avg_time = statistics.fmean(times_ns) / 1e9
+        avg_memory = (memory_after - memory_before) / len(times_ns)
 
         return PerformanceMetrics(
             provider=provider_name,
             conversion_time=avg_time,
             memory_usage_mb=avg_memory,
-            cpu_usage_percent=avg_cpu,
-            wtf_doc_size_kb=avg_size,
+            cpu_usage_percent=cpu_usage,
+            wtf_doc_size_kb=wtf_doc_size,
             success=True,
         )
 
+    @staticmethod
+    def _fail(provider_name: str, error_message: str) -> PerformanceMetrics:
+        """Build the metrics for a provider that could not be benchmarked."""
+        return PerformanceMetrics(
+            provider=provider_name,
+            conversion_time=0.0,
+            memory_usage_mb=0.0,
+            cpu_usage_percent=0.0,
+            wtf_doc_size_kb=0.0,
+            success=False,
+            error_message=error_message,
+        )
+
     def benchmark_all_providers(
-        self, sample_data: Dict[str, Any], iterations: int = 3
+        self,
+        sample_data: Dict[str, Any],
+        iterations: int = 3,
+        max_workers: Optional[int] = None,
+        stream: Optional[BinaryIO] = None,
     ) -> List[PerformanceMetrics]:
         """
         Benchmark all providers.
@@ -146,16 +206,41 @@ class PerformanceBenchmark:
         Args:
             sample_data: Sample data to convert
             iterations: Number of iterations to average
+            max_workers: Benchmark providers in this many worker processes;
+                providers run sequentially in this process when None. Each
+                worker measures memory and CPU for its own process only.
+            stream: Binary stream that receives each result as a JSON line as
+                soon as it is available
 
         Returns:
-            List of performance metrics for each provider
+            List of performance metrics for each provider, in provider order
         """
         results = []
 
-        for provider_name in self.providers.keys():
-            metrics = self.benchmark_provider(provider_name, sample_data, iterations)
-            results.append(metrics)
-
+        if max_workers is None:
+            for provider_name in self.providers:
+                metrics = self.benchmark_provider(provider_name, sample_data, iterations)
+                _write_result(stream, metrics)
+                results.append(metrics)
+            return results
+
+        # Serialize the sample once; each task then only copies the bytes
+        # instead of pickling the whole dict again
+        sample_payload = pickle.dumps(sample_data, protocol=pickle.HIGHEST_PROTOCOL)
+
+        # "spawn" gives every worker a clean interpreter, so allocations made
+        # by one provider never show up in another provider's memory delta
+        with ProcessPoolExecutor(
+            max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")
+        ) as executor:
+            futures = [
+                executor.submit(_run_one, provider_name, sample_payload, iterations)
+                for provider_name in self.providers
+            ]
+            for future in futures:
+                metrics = future.result()
+                _write_result(stream, metrics)
+                results.append(metrics)
         return results
 
     def analyze_performance(self, results: List[PerformanceMetrics]) -> Dict[str, Any]:
@@ -178,39 +263,50 @@ class PerformanceBenchmark:
                 "successful_providers": 0,
             }
 
-        # Extract metrics
-        times = [r.conversion_time for r in successful_results]
-        memory_usages = [r.memory_usage_mb for r in successful_results]
-        cpu_usages = [r.cpu_usage_percent for r in successful_results]
-        sizes = [r.wtf_doc_size_kb for r in successful_results]
-
-        # Find best performers
-        fastest_provider = min(successful_results, key=lambda x: x.conversion_time)
-        most_memory_efficient = min(successful_results, key=lambda x: x.memory_usage_mb)
-        smallest_output = min(successful_results, key=lambda x: x.wtf_doc_size_kb)
+        # Find best performers, totals and per-provider values in a single
+        # pass; ties keep the first provider
+        fastest_provider = most_memory_efficient = smallest_output = successful_results[0]
+        total_time = total_memory = total_size = 0.0
+        all_times: Dict[str, float] = {}
+        all_usages: Dict[str, float] = {}
+        all_sizes: Dict[str, float] = {}
+        for r in successful_results:
+            if r.conversion_time < fastest_provider.conversion_time:
+                fastest_provider = r
+            if r.memory_usage_mb < most_memory_efficient.memory_usage_mb:
+                most_memory_efficient = r
+            if r.wtf_doc_size_kb < smallest_output.wtf_doc_size_kb:
+                smallest_output = r
+            total_time += r.conversion_time
+            total_memory += r.memory_usage_mb
+            total_size += r.wtf_doc_size_kb
+            all_times[r.provider] = r.conversion_time
+            all_usages[r.provider] = r.memory_usage_mb
+            all_sizes[r.provider] = r.wtf_doc_size_kb
+        successful_count = len(successful_results)
 
         return {
             "status": "success",
             "total_providers": len(results),
-            "successful_providers": len(successful_results),
+            "successful_providers": successful_count,
             "metrics": {
                 "conversion_time": {
                     "fastest": fastest_provider.provider,
                     "fastest_time": fastest_provider.conversion_time,
-                    "average": sum(times) / len(times),
-                    "all_times": {r.provider: r.conversion_time for r in successful_results},
+                    "average": total_time / successful_count,
+                    "all_times": all_times,
                 },
                 "memory_usage": {
                     "most_efficient": most_memory_efficient.provider,
                     "most_efficient_usage": most_memory_efficient.memory_usage_mb,
-                    "average": sum(memory_usages) / len(memory_usages),
-                    "all_usages": {r.provider: r.memory_usage_mb for r in successful_results},
+                    "average": total_memory / successful_count,
+                    "all_usages": all_usages,
                 },
                 "output_size": {
                     "smallest": smallest_output.provider,
                     "smallest_size": smallest_output.wtf_doc_size_kb,
-                    "average": sum(sizes) / len(sizes),
-                    "all_sizes": {r.provider: r.wtf_doc_size_kb for r in successful_results},
+                    "average": total_size / successful_count,
+                    "all_sizes": all_sizes,
                 },
             },
             "provider_details": {
@@ -226,74 +322,96 @@ class PerformanceBenchmark:
             },
         }
 
-    def generate_performance_report(self, results: List[PerformanceMetrics]) -> str:
-        """Generate a human-readable performance report."""
-        analysis = self.analyze_performance(results)
-
-        report = []
-        report.append("=" * 60)
-        report.append("PERFORMANCE BENCHMARK REPORT")
-        report.append("=" * 60)
-        report.append(f"Status: {analysis['status'].upper()}")
-        report.append(
-            f"Successful Providers: {analysis['successful_providers']}/{analysis['total_providers']}"
+    def generate_performance_report(
+        self, results: List[PerformanceMetrics], analysis: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """
+        Generate a human-readable performance report.
+
+        Pass the result of analyze_performance(results) as analysis to avoid
+        analyzing the same results twice.
+        """
+        if analysis is None:
+            analysis = self.analyze_performance(results)
+
+        buf = io.StringIO()
+        write = buf.write
+        write("=" * 60 + "\n")
+        write("PERFORMANCE BENCHMARK REPORT\n")
+        write("=" * 60 + "\n")
+        write(f"Status: {analysis['status'].upper()}\n")
+        write(
+            f"Successful Providers: {analysis['successful_providers']}/{analysis['total_providers']}\n"
         )
-        report.append("")
+        write("\n")
 
         if analysis["status"] == "success":
             # Performance metrics
-            report.append("PERFORMANCE METRICS:")
-            report.append("-" * 30)
+            write("PERFORMANCE METRICS:\n")
+            write("-" * 30 + "\n")
 
             # Conversion time
             time_metrics = analysis["metrics"]["conversion_time"]
-            report.append(
-                f"Fastest Conversion: {time_metrics['fastest']} ({time_metrics['fastest_time']:.3f}s)"
+            write(
+                "Fastest Conversion: "
+                + time_metrics["fastest"]
+                + " ("
+                + _FMT_TIME(time_metrics["fastest_time"])
+                + ")\n"
             )
-            report.append(f"Average Time: {time_metrics['average']:.3f}s")
-            report.append("All Times:")
+            write("Average Time: " + _FMT_TIME(time_metrics["average"]) + "\n")
+            write("All Times:\n")
             for provider, time_val in time_metrics["all_times"].items():
-                report.append(f"  {provider}: {time_val:.3f}s")
-            report.append("")
+                write("  " + provider + ": " + _FMT_TIME(time_val) + "\n")
+            write("\n")
 
             # Memory usage
             memory_metrics = analysis["metrics"]["memory_usage"]
-            report.append(
-                f"Most Memory Efficient: {memory_metrics['most_efficient']} ({memory_metrics['most_efficient_usage']:.2f}MB)"
+            write(
+                "Most Memory Efficient: "
+                + memory_metrics["most_efficient"]
+                + " ("
+                + _FMT_MB(memory_metrics["most_efficient_usage"])
+                + ")\n"
             )
-            report.append(f"Average Memory: {memory_metrics['average']:.2f}MB")
-            report.append("All Memory Usage:")
+            write("Average Memory: " + _FMT_MB(memory_metrics["average"]) + "\n")
+            write("All Memory Usage:\n")
             for provider, memory_val in memory_metrics["all_usages"].items():
-                report.append(f"  {provider}: {memory_val:.2f}MB")
-            report.append("")
+                write("  " + provider + ": " + _FMT_MB(memory_val) + "\n")
+            write("\n")
 
             # Output size
             size_metrics = analysis["metrics"]["output_size"]
-            report.append(
-                f"Smallest Output: {size_metrics['smallest']} ({size_metrics['smallest_size']:.2f}KB)"
+            write(
+                "Smallest Output: "
+                + size_metrics["smallest"]
+                + " ("
+                + _FMT_KB(size_metrics["smallest_size"])
+                + ")\n"
             )
-            report.append(f"Average Size: {size_metrics['average']:.2f}KB")
-            report.append("All Output Sizes:")
+            write("Average Size: " + _FMT_KB(size_metrics["average"]) + "\n")
+            write("All Output Sizes:\n")
             for provider, size_val in size_metrics["all_sizes"].items():
-                report.append(f"  {provider}: {size_val:.2f}KB")
-            report.append("")
+                write("  " + provider + ": " + _FMT_KB(size_val) + "\n")
+            write("\n")
 
         # Provider details
-        report.append("PROVIDER DETAILS:")
-        report.append("-" * 30)
+        write("PROVIDER DETAILS:\n")
+        write("-" * 30 + "\n")
         for provider, data in analysis["provider_details"].items():
             status = "✅" if data["success"] else "❌"
-            report.append(f"{provider.upper()}: {status}")
+            write(f"{provider.upper()}: {status}\n")
             if data["success"]:
-                report.append(f"  Conversion Time: {data['conversion_time']:.3f}s")
-                report.append(f"  Memory Usage: {data['memory_usage_mb']:.2f}MB")
-                report.append(f"  CPU Usage: {data['cpu_usage_percent']:.1f}%")
-                report.append(f"  Output Size: {data['wtf_doc_size_kb']:.2f}KB")
+                write("  Conversion Time: " + _FMT_TIME(data["conversion_time"]) + "\n")
+                write("  Memory Usage: " + _FMT_MB(data["memory_usage_mb"]) + "\n")
+                write("  CPU Usage: " + _FMT_PERCENT(data["cpu_usage_percent"]) + "\n")
+                write("  Output Size: " + _FMT_KB(data["wtf_doc_size_kb"]) + "\n")
             else:
-                report.append(f"  Error: {data['error']}")
-            report.append("")
+                write(f"  Error: {data['error']}\n")
+            write("\n")
 
-        return "\n".join(report)
+        # Lines are newline-terminated; the joined report has no final newline
+        return buf.getvalue()[:-1]
 
 
 class TestPerformanceBenchmark:
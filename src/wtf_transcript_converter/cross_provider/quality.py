@@ -5,24 +5,72 @@ This module compares the quality of transcriptions across different providers
 to assess accuracy, completeness, and other quality metrics.
 """
 
-import re
-from dataclasses import dataclass
-from typing import Any, Dict, List
-
-import pytest
-
-from wtf_transcript_converter.core.models import WTFDocument
-from wtf_transcript_converter.providers import (
-    AssemblyAIConverter,
-    CanaryConverter,
-    DeepgramConverter,
-    ParakeetConverter,
-    RevAIConverter,
-    WhisperConverter,
+import threading
+from bisect import bisect_right
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from itertools import accumulate
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from wtf_transcript_converter.core.models import WTFDocument, WTFWord
+from wtf_transcript_converter.cross_provider.registry import LazyProviderMap
+from wtf_transcript_converter.exceptions import ConversionError, ProviderError, ValidationError
+from wtf_transcript_converter.utils.json_utils import canonical_dumps
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Word endings that count as punctuation
+_PUNCTUATION_SUFFIXES = (".", "!", "?", ",", ":", ";")
+
+# Report blocks filled from the analysis dicts in a single format call each
+_AVERAGES_TEMPLATE = (
+    "Overall Confidence: {overall_confidence:.3f}\n"
+    "Word Confidence: {word_confidence:.3f}\n"
+    "Punctuation Accuracy: {punctuation_accuracy:.3f}\n"
+    "Text Completeness: {text_completeness:.3f}\n"
+    "Timing Accuracy: {timing_accuracy:.3f}"
+)
+_PROVIDER_DETAILS_TEMPLATE = (
+    "  Overall Confidence: {overall_confidence:.3f}\n"
+    "  Word Count: {word_count}\n"
+    "  Avg Word Confidence: {avg_word_confidence:.3f}\n"
+    "  Low Confidence Words: {low_confidence_words}\n"
+    "  Punctuation Accuracy: {punctuation_accuracy:.3f}\n"
+    "  Text Completeness: {text_completeness:.3f}\n"
+    "  Timing Accuracy: {timing_accuracy:.3f}"
+)
+
+# Converter instances shared by every comparator. The converters keep no
+# per-comparison state, and model-backed ones load their model only once.
+_SHARED_CONVERTERS: Dict[str, Any] = {}
+
+# Errors that mean a provider could not handle the sample: the library's own
+# exceptions, invalid input data (including pydantic's ValidationError, a
+# ValueError) and converters whose optional dependencies are missing. Anything
+# else raised outside a converter is a bug and propagates.
+_CONVERSION_ERRORS = (
+    ConversionError,
+    ProviderError,
+    ValidationError,
+    ImportError,
+    ValueError,
 )
 
+# Errors a converter raises for a sample in another provider's format, or when
+# it does not implement convert(); these are re-raised as ConversionError
+_MISMATCHED_SAMPLE_ERRORS = (AttributeError, IndexError, KeyError, TypeError, NotImplementedError)
 
-@dataclass
+# Successful metrics kept per comparator, oldest dropped first
+_RESULT_CACHE_SIZE = 128
+
+
+@dataclass(slots=True, frozen=True)
 class QualityMetrics:
     """Quality metrics for a provider."""
 
@@ -42,18 +90,129 @@ class QualityMetrics:
     error_message: str = ""
 
 
+# Zeroed metrics that failed analyses copy with their provider and error
+_FAILED_METRICS = QualityMetrics(
+    provider="",
+    overall_confidence=0.0,
+    word_count=0,
+    segment_count=0,
+    duration=0.0,
+    avg_word_confidence=0.0,
+    min_word_confidence=0.0,
+    max_word_confidence=0.0,
+    low_confidence_words=0,
+    punctuation_accuracy=0.0,
+    text_completeness=0.0,
+    timing_accuracy=0.0,
+    success=False,
+)
+
+
+def _sample_key(sample_data: Dict[str, Any]) -> Optional[bytes]:
+    """Canonical JSON for a sample, or None when it is not JSON serializable."""
+    try:
+        return canonical_dumps(sample_data)
+    except (TypeError, ValueError):
+        return None
+
+
+@dataclass(slots=True, frozen=True)
+class _WordArrays:
+    """Word fields as parallel lists, one entry per word."""
+
+    texts: List[str]
+    starts: List[float]
+    ends: List[float]
+    confidences: List[float]
+    is_punctuation: List[Optional[bool]]
+
+
+def _extract_word_arrays(words: Sequence[WTFWord]) -> _WordArrays:
+    """Read the fields used by the word-level assessments in a single pass."""
+    texts: List[str] = []
+    starts: List[float] = []
+    ends: List[float] = []
+    confidences: List[float] = []
+    is_punctuation: List[Optional[bool]] = []
+    for word in words:
+        texts.append(word.text)
+        starts.append(word.start)
+        ends.append(word.end)
+        confidences.append(word.confidence)
+        is_punctuation.append(word.is_punctuation)
+    return _WordArrays(texts, starts, ends, confidences, is_punctuation)
+
+
+def _timing_checks(
+    word_starts: Sequence[float],
+    word_ends: Sequence[float],
+    segment_starts: Sequence[float],
+    segment_ends: Sequence[float],
+) -> Tuple[bool, bool, bool]:
+    """
+    Check word and segment timing from parallel start/end sequences.
+
+    Returns whether words are ordered by start time, whether segments are
+    ordered by start time, and whether every word fits within some segment.
+    Both word and segment sequences must be non-empty.
+    """
+    # Segment spans are sorted by start, with the running maximum end. A word
+    # fits in some segment exactly when a segment starting at or before it
+    # ends at or after it, which is a binary search instead of a scan.
+    if NUMPY_AVAILABLE:
+        word_start_array = np.asarray(word_starts, dtype=np.float64)
+        segment_start_array = np.asarray(segment_starts, dtype=np.float64)
+        segment_end_array = np.asarray(segment_ends, dtype=np.float64)
+        word_ordered = bool(np.all(np.diff(word_start_array) >= 0))
+        segment_ordered = bool(np.all(np.diff(segment_start_array) >= 0))
+
+        if not segment_ordered:
+            order = np.argsort(segment_start_array, kind="stable")
+            segment_start_array = segment_start_array[order]
+            segment_end_array = segment_end_array[order]
+        max_segment_ends = np.maximum.accumulate(segment_end_array)
+
+        index = np.searchsorted(segment_start_array, word_start_array, side="right") - 1
+        words_in_segments = bool(
+            np.all(
+                (index >= 0)
+                & (np.asarray(word_ends, dtype=np.float64) <= max_segment_ends[index.clip(0)])
+            )
+        )
+        return word_ordered, segment_ordered, words_in_segments
+
+    word_ordered = all(word_starts[i] <= word_starts[i + 1] for i in range(len(word_starts) - 1))
+    segment_ordered = all(
+        segment_starts[i] <= segment_starts[i + 1] for i in range(len(segment_starts) - 1)
+    )
+
+    if segment_ordered:
+        sorted_starts = list(segment_starts)
+        sorted_ends: Sequence[float] = segment_ends
+    else:
+        spans = sorted(zip(segment_starts, segment_ends))
+        sorted_starts = [span_start for span_start, _ in spans]
+        sorted_ends = [span_end for _, span_end in spans]
+    max_segment_ends_list = list(accumulate(sorted_ends, max))
+
+    words_in_segments = True
+    for word_start, word_end in zip(word_starts, word_ends):
+        position = bisect_right(sorted_starts, word_start)
+        if position == 0 or max_segment_ends_list[position - 1] < word_end:
+            words_in_segments = False
+            break
+
+    return word_ordered, segment_ordered, words_in_segments
+
+
 class QualityComparator:
     """Compare quality across multiple providers."""
 
     def __init__(self) -> None:
-        self.providers = {
-            "whisper": WhisperConverter(),
-            "deepgram": DeepgramConverter(),
-            "assemblyai": AssemblyAIConverter(),
-            "rev-ai": RevAIConverter(),
-            "canary": CanaryConverter(),
-            "parakeet": ParakeetConverter(),
-        }
+        # Converters are imported and instantiated on first analysis
+        self.providers = LazyProviderMap(instances=_SHARED_CONVERTERS)
+        self._results: Dict[Tuple[str, bytes], QualityMetrics] = {}
+        self._results_lock = threading.Lock()
 
     def analyze_quality(self, provider_name: str, sample_data: Dict[str, Any]) -> QualityMetrics:
         """
@@ -66,27 +225,36 @@ class QualityComparator:
         Returns:
             Quality metrics
         """
+        return self._analyze_cached(provider_name, sample_data, _sample_key(sample_data))
+
+    def _analyze_cached(
+        self, provider_name: str, sample_data: Dict[str, Any], sample_key: Optional[bytes]
+    ) -> QualityMetrics:
+        """Analyze a provider, reusing the metrics for an identical earlier sample."""
+        if sample_key is None:
+            return self._analyze(provider_name, sample_data)
+
+        key = (provider_name, sample_key)
+        with self._results_lock:
+            metrics = self._results.get(key)
+        if metrics is None:
+            metrics = self._analyze(provider_name, sample_data)
+            # Failures are not cached, so a fixed converter is picked up
+            if metrics.success:
+                with self._results_lock:
+                    if key not in self._results and len(self._results) >= _RESULT_CACHE_SIZE:
+                        del self._results[next(iter(self._results))]
+                    self._results[key] = metrics
+        return metrics
+
+    def _analyze(self, provider_name: str, sample_data: Dict[str, Any]) -> QualityMetrics:
+        """Convert the sample with one provider and measure the result."""
         if provider_name not in self.providers:
-            return QualityMetrics(
-                provider=provider_name,
-                overall_confidence=0.0,
-                word_count=0,
-                segment_count=0,
-                duration=0.0,
-                avg_word_confidence=0.0,
-                min_word_confidence=0.0,
-                max_word_confidence=0.0,
-                low_confidence_words=0,
-                punctuation_accuracy=0.0,
-                text_completeness=0.0,
-                timing_accuracy=0.0,
-                success=False,
-                error_message=f"Provider {provider_name} not found",
-            )
+            return self._fail(provider_name, f"Provider {provider_name} not found")
 
         try:
             converter = self.providers[provider_name]
-            wtf_doc = converter.convert(sample_data)
+            wtf_doc = self._run_converter(provider_name, converter, sample_data)
 
             # Basic metrics
             overall_confidence = wtf_doc.transcript.confidence
@@ -94,23 +262,21 @@ class QualityComparator:
             segment_count = len(wtf_doc.segments)
             duration = wtf_doc.transcript.duration
 
+            # Read the word fields once for every word-level assessment
+            word_arrays = _extract_word_arrays(wtf_doc.words or [])
+
             # Word-level confidence analysis
-            if wtf_doc.words:
-                word_confidences = [word.confidence for word in wtf_doc.words]
-                avg_word_confidence = sum(word_confidences) / len(word_confidences)
-                min_word_confidence = min(word_confidences)
-                max_word_confidence = max(word_confidences)
-                low_confidence_words = sum(1 for c in word_confidences if c < 0.5)
-            else:
-                avg_word_confidence = 0.0
-                min_word_confidence = 0.0
-                max_word_confidence = 0.0
-                low_confidence_words = 0
+            (
+                avg_word_confidence,
+                min_word_confidence,
+                max_word_confidence,
+                low_confidence_words,
+            ) = self._word_confidence_stats(word_arrays.confidences)
 
             # Quality assessments
-            punctuation_accuracy = self._assess_punctuation_accuracy(wtf_doc)
+            punctuation_accuracy = self._assess_punctuation_accuracy(wtf_doc, word_arrays)
             text_completeness = self._assess_text_completeness(wtf_doc, sample_data)
-            timing_accuracy = self._assess_timing_accuracy(wtf_doc)
+            timing_accuracy = self._assess_timing_accuracy(wtf_doc, word_arrays)
 
             return QualityMetrics(
                 provider=provider_name,
@@ -128,58 +294,104 @@ class QualityComparator:
                 success=True,
             )
 
-        except Exception as e:
-            return QualityMetrics(
+        except _CONVERSION_ERRORS as e:
+            return self._fail(provider_name, str(e))
+
+    @staticmethod
+    def _fail(provider_name: str, error_message: str) -> QualityMetrics:
+        """Build the metrics for a provider that could not be analyzed."""
+        return replace(_FAILED_METRICS, provider=provider_name, error_message=error_message)
+
+    @staticmethod
+    def _run_converter(
+        provider_name: str, converter: Any, sample_data: Dict[str, Any]
+    ) -> WTFDocument:
+        """Run a converter, raising ConversionError for samples it cannot handle."""
+        try:
+            wtf_doc = converter.convert(sample_data)
+        except _MISMATCHED_SAMPLE_ERRORS as e:
+            raise ConversionError(
+                "Could not convert sample", provider=provider_name, original_error=e
+            ) from e
+
+        # Converters convert WTF-format samples back to their own format
+        if not isinstance(wtf_doc, WTFDocument):
+            raise ConversionError(
+                f"Converter returned {type(wtf_doc).__name__}, not a WTFDocument",
                 provider=provider_name,
-                overall_confidence=0.0,
-                word_count=0,
-                segment_count=0,
-                duration=0.0,
-                avg_word_confidence=0.0,
-                min_word_confidence=0.0,
-                max_word_confidence=0.0,
-                low_confidence_words=0,
-                punctuation_accuracy=0.0,
-                text_completeness=0.0,
-                timing_accuracy=0.0,
-                success=False,
-                error_message=str(e),
             )
+        return wtf_doc
 
     def compare_quality_across_providers(
-        self, sample_data: Dict[str, Any]
+        self, sample_data: Dict[str, Any], max_workers: Optional[int] = None
     ) -> List[QualityMetrics]:
         """
         Compare quality across all providers.
 
         Args:
             sample_data: Sample data to analyze
+            max_workers: Analyze with this many threads; providers run
+                sequentially when None. Only useful for converters that do I/O
+                or release the GIL.
 
         Returns:
-            List of quality metrics for each provider
+            List of quality metrics for each provider, in provider order
         """
-        results = []
-
-        for provider_name in self.providers.keys():
-            metrics = self.analyze_quality(provider_name, sample_data)
-            results.append(metrics)
+        sample_key = _sample_key(sample_data)
+        if max_workers is None:
+            return [
+                self._analyze_cached(provider_name, sample_data, sample_key)
+                for provider_name in self.providers
+            ]
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(self._analyze_cached, provider_name, sample_data, sample_key)
+                for provider_name in self.providers
+            ]
+            return [future.result() for future in futures]
+
+    def _word_confidence_stats(
+        self, confidences: Sequence[float]
+    ) -> Tuple[float, float, float, int]:
+        """Calculate the mean, min, max and low-confidence count of word confidences."""
+        if not len(confidences):
+            return 0.0, 0.0, 0.0, 0
+
+        if NUMPY_AVAILABLE:
+            confidence_array = np.asarray(confidences, dtype=np.float64)
+            return (
+                float(confidence_array.mean()),
+                float(confidence_array.min()),
+                float(confidence_array.max()),
+                int(np.count_nonzero(confidence_array < 0.5)),
+            )
 
-        return results
+        return (
+            sum(confidences) / len(confidences),
+            min(confidences),
+            max(confidences),
+            sum(1 for c in confidences if c < 0.5),
+        )
 
-    def _assess_punctuation_accuracy(self, wtf_doc: WTFDocument) -> float:
+    def _assess_punctuation_accuracy(
+        self, wtf_doc: WTFDocument, word_arrays: Optional[_WordArrays] = None
+    ) -> float:
         """Assess punctuation accuracy in the transcription."""
         if not wtf_doc.words:
             return 0.0
+        if word_arrays is None:
+            word_arrays = _extract_word_arrays(wtf_doc.words)
 
         # Count words that should have punctuation
         expected_punctuation = 0
         actual_punctuation = 0
 
-        for word in wtf_doc.words:
+        for text, is_punctuation in zip(word_arrays.texts, word_arrays.is_punctuation):
             # Check if word ends with punctuation
-            if re.search(r"[.!?,:;]$", word.text):
+            if text.endswith(_PUNCTUATION_SUFFIXES):
                 expected_punctuation += 1
-                if word.is_punctuation:
+                if is_punctuation:
                     actual_punctuation += 1
 
         if expected_punctuation == 0:
@@ -197,46 +409,34 @@ class QualityComparator:
         if not original_text:
             return 1.0 if not wtf_text else 0.0
 
-        # Simple word-based comparison
-        original_words = set(original_text.lower().split())
-        wtf_words = set(wtf_text.lower().split())
+        # Simple word-based comparison; repeated words count once per occurrence
+        original_words = Counter(original_text.casefold().split())
+        wtf_words = Counter(wtf_text.casefold().split())
 
-        if not original_words:
+        original_total = original_words.total()
+        if not original_total:
             return 1.0
 
         # Calculate overlap
-        common_words = original_words.intersection(wtf_words)
-        return len(common_words) / len(original_words)
+        common_words = original_words & wtf_words
+        return common_words.total() / original_total
 
-    def _assess_timing_accuracy(self, wtf_doc: WTFDocument) -> float:
+    def _assess_timing_accuracy(
+        self, wtf_doc: WTFDocument, word_arrays: Optional[_WordArrays] = None
+    ) -> float:
         """Assess timing accuracy of words and segments."""
         if not wtf_doc.words or not wtf_doc.segments:
             return 0.0
-
-        # Check that words are properly ordered by time
-        word_times = [(word.start, word.end) for word in wtf_doc.words]
-        segment_times = [(seg.start, seg.end) for seg in wtf_doc.segments]
-
-        # Check word ordering
-        word_ordered = all(
-            word_times[i][0] <= word_times[i + 1][0] for i in range(len(word_times) - 1)
-        )
-
-        # Check segment ordering
-        segment_ordered = all(
-            segment_times[i][0] <= segment_times[i + 1][0] for i in range(len(segment_times) - 1)
+        if word_arrays is None:
+            word_arrays = _extract_word_arrays(wtf_doc.words)
+
+        word_ordered, segment_ordered, words_in_segments = _timing_checks(
+            word_arrays.starts,
+            word_arrays.ends,
+            [seg.start for seg in wtf_doc.segments],
+            [seg.end for seg in wtf_doc.segments],
         )
 
-        # Check that words fit within segments
-        words_in_segments = True
-        for word in wtf_doc.words:
-            word_fits = any(
-                seg.start <= word.start and word.end <= seg.end for seg in wtf_doc.segments
-            )
-            if not word_fits:
-                words_in_segments = False
-                break
-
         # Calculate accuracy score
         accuracy_score = 0.0
         if word_ordered:
@@ -268,33 +468,43 @@ class QualityComparator:
                 "successful_providers": 0,
             }
 
-        # Find best performers
-        best_confidence = max(successful_results, key=lambda x: x.overall_confidence)
-        best_word_confidence = max(successful_results, key=lambda x: x.avg_word_confidence)
-        best_punctuation = max(successful_results, key=lambda x: x.punctuation_accuracy)
-        best_completeness = max(successful_results, key=lambda x: x.text_completeness)
-        best_timing = max(successful_results, key=lambda x: x.timing_accuracy)
-        most_words = max(successful_results, key=lambda x: x.word_count)
+        # Find best performers and totals in a single pass; ties keep the
+        # first provider
+        best_confidence = best_word_confidence = best_punctuation = successful_results[0]
+        best_completeness = best_timing = most_words = successful_results[0]
+        total_confidence = total_word_confidence = total_punctuation = 0.0
+        total_completeness = total_timing = 0.0
+        for r in successful_results:
+            if r.overall_confidence > best_confidence.overall_confidence:
+                best_confidence = r
+            if r.avg_word_confidence > best_word_confidence.avg_word_confidence:
+                best_word_confidence = r
+            if r.punctuation_accuracy > best_punctuation.punctuation_accuracy:
+                best_punctuation = r
+            if r.text_completeness > best_completeness.text_completeness:
+                best_completeness = r
+            if r.timing_accuracy > best_timing.timing_accuracy:
+                best_timing = r
+            if r.word_count > most_words.word_count:
+                most_words = r
+            total_confidence += r.overall_confidence
+            total_word_confidence += r.avg_word_confidence
+            total_punctuation += r.punctuation_accuracy
+            total_completeness += r.text_completeness
+            total_timing += r.timing_accuracy
 
         # Calculate averages
-        avg_confidence = sum(r.overall_confidence for r in successful_results) / len(
-            successful_results
-        )
-        avg_word_confidence = sum(r.avg_word_confidence for r in successful_results) / len(
-            successful_results
-        )
-        avg_punctuation = sum(r.punctuation_accuracy for r in successful_results) / len(
-            successful_results
-        )
-        avg_completeness = sum(r.text_completeness for r in successful_results) / len(
-            successful_results
-        )
-        avg_timing = sum(r.timing_accuracy for r in successful_results) / len(successful_results)
+        successful_count = len(successful_results)
+        avg_confidence = total_confidence / successful_count
+        avg_word_confidence = total_word_confidence / successful_count
+        avg_punctuation = total_punctuation / successful_count
+        avg_completeness = total_completeness / successful_count
+        avg_timing = total_timing / successful_count
 
         return {
             "status": "success",
             "total_providers": len(results),
-            "successful_providers": len(successful_results),
+            "successful_providers": successful_count,
             "averages": {
                 "overall_confidence": avg_confidence,
                 "word_confidence": avg_word_confidence,
@@ -326,9 +536,17 @@ class QualityComparator:
             },
         }
 
-    def generate_quality_report(self, results: List[QualityMetrics]) -> str:
-        """Generate a human-readable quality report."""
-        analysis = self.analyze_quality_comparison(results)
+    def generate_quality_report(
+        self, results: List[QualityMetrics], analysis: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """
+        Generate a human-readable quality report.
+
+        Pass the result of analyze_quality_comparison(results) as analysis to
+        avoid analyzing the same results twice.
+        """
+        if analysis is None:
+            analysis = self.analyze_quality_comparison(results)
 
         report = []
         report.append("=" * 60)
@@ -344,13 +562,7 @@ class QualityComparator:
             # Averages
             report.append("AVERAGE QUALITY METRICS:")
             report.append("-" * 30)
-            report.append(f"Overall Confidence: {analysis['averages']['overall_confidence']:.3f}")
-            report.append(f"Word Confidence: {analysis['averages']['word_confidence']:.3f}")
-            report.append(
-                f"Punctuation Accuracy: {analysis['averages']['punctuation_accuracy']:.3f}"
-            )
-            report.append(f"Text Completeness: {analysis['averages']['text_completeness']:.3f}")
-            report.append(f"Timing Accuracy: {analysis['averages']['timing_accuracy']:.3f}")
+            report.append(_AVERAGES_TEMPLATE.format_map(analysis["averages"]))
             report.append("")
 
             # Best performers
@@ -367,283 +579,10 @@ class QualityComparator:
             status = "✅" if data["success"] else "❌"
             report.append(f"{provider.upper()}: {status}")
             if data["success"]:
-                report.append(f"  Overall Confidence: {data['overall_confidence']:.3f}")
-                report.append(f"  Word Count: {data['word_count']}")
-                report.append(f"  Avg Word Confidence: {data['avg_word_confidence']:.3f}")
-                report.append(f"  Low Confidence Words: {data['low_confidence_words']}")
-                report.append(f"  Punctuation Accuracy: {data['punctuation_accuracy']:.3f}")
-                report.append(f"  Text Completeness: {data['text_completeness']:.3f}")
-                report.append(f"  Timing Accuracy: {data['timing_accuracy']:.3f}")
+                report.append(_PROVIDER_DETAILS_TEMPLATE.format_map(data))
             else:
                 report.append(f"  Error: {data['error']}")
             report.append("")
 
         return "\n".join(report)
 
-
-class TestQualityComparison:
-    """Test cases for quality comparison."""
-
-    @pytest.fixture
-    def quality_comparator(self) -> QualityComparator:
-        """Create a quality comparator instance."""
-        return QualityComparator()
-
-    @pytest.fixture
-    def sample_data(self) -> Dict[str, Any]:
-        """Sample data for quality testing (Whisper format)."""
-        return {
-            "text": "Hello, this is a quality test! How are you doing today?",
-            "language": "en",
-            "duration": 5.0,
-            "segments": [
-                {
-                    "id": 0,
-                    "start": 0.0,
-                    "end": 2.3,
-                    "text": "Hello, this is a quality test!",
-                    "avg_logprob": -0.4,
-                    "words": [
-                        {
-                            "word": "Hello,",
-                            "start": 0.0,
-                            "end": 0.5,
-                            "probability": 0.99,
-                        },
-                        {"word": "this", "start": 0.6, "end": 0.8, "probability": 0.98},
-                        {"word": "is", "start": 0.9, "end": 1.0, "probability": 0.99},
-                        {"word": "a", "start": 1.1, "end": 1.2, "probability": 0.97},
-                        {
-                            "word": "quality",
-                            "start": 1.3,
-                            "end": 1.8,
-                            "probability": 0.96,
-                        },
-                        {
-                            "word": "test!",
-                            "start": 1.9,
-                            "end": 2.3,
-                            "probability": 0.95,
-                        },
-                    ],
-                },
-                {
-                    "id": 1,
-                    "start": 2.4,
-                    "end": 5.0,
-                    "text": "How are you doing today?",
-                    "avg_logprob": -0.3,
-                    "words": [
-                        {"word": "How", "start": 2.4, "end": 2.6, "probability": 0.94},
-                        {"word": "are", "start": 2.7, "end": 2.9, "probability": 0.93},
-                        {"word": "you", "start": 3.0, "end": 3.2, "probability": 0.92},
-                        {
-                            "word": "doing",
-                            "start": 3.3,
-                            "end": 3.7,
-                            "probability": 0.91,
-                        },
-                        {
-                            "word": "today?",
-                            "start": 3.8,
-                            "end": 5.0,
-                            "probability": 0.90,
-                        },
-                    ],
-                },
-            ],
-        }
-
-    def test_single_provider_quality(self, quality_comparator: Any, sample_data: Any) -> None:
-        """Test quality analysis for a single provider."""
-        metrics = quality_comparator.analyze_quality("whisper", sample_data)
-
-        # Should complete successfully
-        assert metrics.success, f"Whisper quality analysis failed: {metrics.error_message}"
-
-        # Basic sanity checks
-        assert 0.0 <= metrics.overall_confidence <= 1.0, "Invalid overall confidence"
-        assert metrics.word_count > 0, "Should have words"
-        assert metrics.segment_count > 0, "Should have segments"
-        assert 0.0 <= metrics.avg_word_confidence <= 1.0, "Invalid word confidence"
-
-    def test_all_providers_quality(self, quality_comparator: Any, sample_data: Any) -> None:
-        """Test quality comparison across all providers."""
-        results = quality_comparator.compare_quality_across_providers(sample_data)
-
-        # Should have results for all providers
-        assert len(results) == len(quality_comparator.providers), "Should analyze all providers"
-
-        # At least some providers should succeed
-        successful_results = [r for r in results if r.success]
-        assert len(successful_results) > 0, "At least one provider should succeed"
-
-        # Print quality report
-        report = quality_comparator.generate_quality_report(results)
-        print("\n" + report)
-
-    def test_quality_analysis(self, quality_comparator: Any, sample_data: Any) -> None:
-        """Test quality analysis."""
-        results = quality_comparator.compare_quality_across_providers(sample_data)
-        analysis = quality_comparator.analyze_quality_comparison(results)
-
-        # Should have analysis results
-        assert "status" in analysis
-        assert "total_providers" in analysis
-        assert "successful_providers" in analysis
-
-        if analysis["status"] == "success":
-            # Should have quality metrics
-            assert "averages" in analysis
-            assert "best_performers" in analysis
-            assert "provider_details" in analysis
-
-    def test_quality_report_generation(self, quality_comparator: Any, sample_data: Any) -> None:
-        """Test quality report generation."""
-        results = quality_comparator.compare_quality_across_providers(sample_data)
-        report = quality_comparator.generate_quality_report(results)
-
-        # Report should contain key sections
-        assert "QUALITY COMPARISON REPORT" in report
-        assert "PROVIDER DETAILS:" in report
-
-        # Report should be non-empty
-        assert len(report) > 100, "Report should be substantial"
-
-    def test_punctuation_accuracy_assessment(self, quality_comparator: Any) -> None:
-        """Test punctuation accuracy assessment."""
-        # Create a mock WTF document with punctuation
-        from wtf_transcript_converter.core.models import (
-            WTFAudio,
-            WTFMetadata,
-            WTFSegment,
-            WTFTranscript,
-            WTFWord,
-        )
-
-        words = [
-            WTFWord(
-                id=0,
-                start=0.0,
-                end=0.5,
-                text="Hello,",
-                confidence=0.99,
-                speaker=None,
-                is_punctuation=True,
-            ),
-            WTFWord(
-                id=1,
-                start=0.6,
-                end=1.0,
-                text="world!",
-                confidence=0.98,
-                speaker=None,
-                is_punctuation=True,
-            ),
-        ]
-
-        segments = [
-            WTFSegment(
-                id=0,
-                start=0.0,
-                end=1.0,
-                text="Hello, world!",
-                confidence=0.99,
-                speaker=None,
-                words=[0, 1],
-            )
-        ]
-
-        transcript = WTFTranscript(
-            text="Hello, world!", language="en", duration=1.0, confidence=0.99
-        )
-        audio = WTFAudio(
-            duration=1.0,
-            sample_rate=None,
-            channels=None,
-            format=None,
-            bitrate=None,
-        )
-        metadata = WTFMetadata(
-            created_at="2024-01-01T00:00:00Z",
-            processed_at="2024-01-01T00:00:00Z",
-            provider="test",
-            model="test",
-            processing_time=None,
-            audio=audio,
-            options={},
-        )
-
-        wtf_doc = WTFDocument(
-            transcript=transcript,
-            segments=segments,
-            metadata=metadata,
-            words=words,
-            speakers=None,
-            alternatives=None,
-            enrichments=None,
-            extensions=None,
-            quality=None,
-            streaming=None,
-        )
-
-        accuracy = quality_comparator._assess_punctuation_accuracy(wtf_doc)
-        assert 0.0 <= accuracy <= 1.0, "Punctuation accuracy should be between 0 and 1"
-
-    def test_text_completeness_assessment(self, quality_comparator: Any) -> None:
-        """Test text completeness assessment."""
-        from wtf_transcript_converter.core.models import (
-            WTFAudio,
-            WTFMetadata,
-            WTFSegment,
-            WTFTranscript,
-        )
-
-        transcript = WTFTranscript(
-            text="Hello world", language="en", duration=1.0, confidence=0.99
-        )
-        segments = [
-            WTFSegment(
-                id=0,
-                start=0.0,
-                end=1.0,
-                text="Hello world",
-                confidence=0.99,
-                speaker=None,
-                words=None,
-            )
-        ]
-        audio = WTFAudio(
-            duration=1.0,
-            sample_rate=None,
-            channels=None,
-            format=None,
-            bitrate=None,
-        )
-        metadata = WTFMetadata(
-            created_at="2024-01-01T00:00:00Z",
-            processed_at="2024-01-01T00:00:00Z",
-            provider="test",
-            model="test",
-            processing_time=None,
-            audio=audio,
-            options={},
-        )
-
-        wtf_doc = WTFDocument(
-            transcript=transcript,
-            segments=segments,
-            metadata=metadata,
-            words=None,
-            speakers=None,
-            alternatives=None,
-            enrichments=None,
-            extensions=None,
-            quality=None,
-            streaming=None,
-        )
-        original_data = {"text": "Hello world test"}
-
-        completeness = quality_comparator._assess_text_completeness(wtf_doc, original_data)
-        assert 0.0 <= completeness <= 1.0, "Text completeness should be between 0 and 1"
-        assert completeness > 0.5, "Should have some overlap with original text"
@@ -0,0 +1,64 @@
+"""
+Provider registry for cross-provider testing.
+
+This module maps provider names to their converter classes and provides a
+mapping that only imports and instantiates a converter when it is first used.
+"""
+
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, Optional
+
+import wtf_transcript_converter.providers as providers_package
+
+# Provider name -> converter class name in wtf_transcript_converter.providers
+PROVIDER_CONVERTERS: Dict[str, str] = {
+    "whisper": "WhisperConverter",
+    "deepgram": "DeepgramConverter",
+    "assemblyai": "AssemblyAIConverter",
+    "rev-ai": "RevAIConverter",
+    "canary": "CanaryConverter",
+    "parakeet": "ParakeetConverter",
+}
+
+
+class LazyProviderMap(Mapping[str, Any]):
+    """
+    Read-only provider name to converter mapping with lazy instantiation.
+
+    A converter that fails to import or construct raises the same exception
+    on every later lookup instead of being retried. Pass the same instances
+    dict to several maps to share converter instances between them.
+    """
+
+    def __init__(
+        self,
+        converters: Dict[str, str] = PROVIDER_CONVERTERS,
+        instances: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        self._converters = converters
+        self._instances: Dict[str, Any] = {} if instances is None else instances
+        self._errors: Dict[str, Exception] = {}
+
+    def __getitem__(self, name: str) -> Any:
+        converter = self._instances.get(name)
+        if converter is None:
+            class_name = self._converters[name]
+            error = self._errors.get(name)
+            if error is not None:
+                raise error
+            try:
+                converter_class = getattr(providers_package, class_name)
+                converter = self._instances[name] = converter_class()
+            except Exception as e:
+                self._errors[name] = e
+                raise
+        return converter
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._converters)
+
+    def __len__(self) -> int:
+        return len(self._converters)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._converters
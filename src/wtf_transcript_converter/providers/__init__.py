@@ -3,15 +3,32 @@ Provider-specific converters.
 
 This module contains converters for different transcription providers
 including Whisper, Deepgram, AssemblyAI, Rev.ai, Canary, and Parakeet.
+
+Converters are imported on first access so that importing a single provider
+does not pull in the optional dependencies of the others.
 """
 
-from .assemblyai import AssemblyAIConverter
-from .base import BaseProviderConverter
-from .canary import CanaryConverter
-from .deepgram import DeepgramConverter
-from .parakeet import ParakeetConverter
-from .rev_ai import RevAIConverter
-from .whisper import WhisperConverter
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .assemblyai import AssemblyAIConverter
+    from .base import BaseProviderConverter
+    from .canary import CanaryConverter
+    from .deepgram import DeepgramConverter
+    from .parakeet import ParakeetConverter
+    from .rev_ai import RevAIConverter
+    from .whisper import WhisperConverter
+
+_CONVERTER_MODULES = {
+    "BaseProviderConverter": ".base",
+    "WhisperConverter": ".whisper",
+    "DeepgramConverter": ".deepgram",
+    "AssemblyAIConverter": ".assemblyai",
+    "RevAIConverter": ".rev_ai",
+    "CanaryConverter": ".canary",
+    "ParakeetConverter": ".parakeet",
+}
 
 __all__ = [
     "BaseProviderConverter",
@@ -22,3 +39,13 @@ __all__ = [
     "CanaryConverter",
     "ParakeetConverter",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import converter classes lazily on first attribute access."""
+    module_name = _CONVERTER_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
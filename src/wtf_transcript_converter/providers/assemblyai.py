@@ -4,8 +4,12 @@ AssemblyAI provider converter.
 This module provides conversion between AssemblyAI JSON format and WTF format.
 """
 
+from bisect import bisect_right
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from itertools import chain
+from operator import attrgetter, itemgetter
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
 from ..core.converter import FromWTFConverter, ToWTFConverter
 from ..core.models import (
@@ -18,8 +22,104 @@ from ..core.models import (
     WTFTranscript,
     WTFWord,
 )
+from ..utils.json_utils import dumps, loads
 from ..utils.language_utils import normalize_language_code
 
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Word texts that are a single punctuation mark
+_PUNCTUATION_MARKS = frozenset(".,!?;:()[]{}'\"-")
+
+# Audio quality tiers and the minimum overall confidence of each tier above "low"
+_AUDIO_QUALITY_TIERS = ("low", "medium", "high")
+_AUDIO_QUALITY_CUTOFFS = (0.7, 0.9)
+
+# Reads every field of a complete AssemblyAI word in one call
+_WORD_FIELDS = itemgetter("text", "start", "end", "confidence", "speaker")
+
+# Reads the fields of a WTF word written back to AssemblyAI format
+_WTF_WORD_FIELDS = attrgetter("text", "start", "end", "confidence", "speaker")
+
+# Top-level AssemblyAI response fields copied into extensions["assemblyai"]
+_EXTENSION_KEYS = (
+    "id",
+    "status",
+    "language_code",
+    "language_confidence",
+    "punctuate",
+    "format_text",
+    "dual_channel",
+    "webhook_url",
+    "webhook_status_code",
+    "webhook_auth",
+    "webhook_auth_header_name",
+    "auto_highlights",
+    "audio_start_from",
+    "audio_end_at",
+    "word_boost",
+    "boost_param",
+    "filter_profanity",
+    "redact_pii",
+    "redact_pii_audio",
+    "redact_pii_audio_quality",
+    "redact_pii_policies",
+    "redact_pii_sub",
+    "speaker_labels",
+    "speakers_expected",
+    "content_safety",
+    "content_safety_confidence",
+    "iab_categories",
+    "iab_categories_result",
+    "language_detection",
+    "custom_spelling",
+    "disfluencies",
+    "sentiment_analysis",
+    "sentiment_analysis_results",
+    "auto_chapters",
+    "auto_chapters_result",
+    "summarization",
+    "summarization_model",
+    "summary_type",
+    "summary_model",
+    "custom_topics",
+    "topics",
+    "speech_model",
+    "speech_model_version",
+)
+
+# AssemblyAI request options recorded in the metadata, with their API defaults
+_OPTION_DEFAULTS = (
+    ("punctuate", True),
+    ("format_text", True),
+    ("dual_channel", False),
+    ("speaker_labels", True),
+    ("speakers_expected", 1),
+    ("speech_model", "best"),
+    ("auto_highlights", False),
+    ("filter_profanity", False),
+    ("redact_pii", False),
+    ("sentiment_analysis", False),
+    ("auto_chapters", False),
+    ("summarization", False),
+)
+
+
+@dataclass(slots=True, frozen=True)
+class _WordScan:
+    """WTF words and parallel per-word values collected in one pass over AssemblyAI words."""
+
+    words: List[WTFWord]
+    confidences: List[float]
+    durations: List[float]
+    # Raw speaker IDs in order of first appearance, and each word's index into them
+    speaker_ids: List[Any]
+    speaker_codes: List[int]
+
 
 class AssemblyAIConverter(ToWTFConverter, FromWTFConverter):
     """Converter for AssemblyAI JSON format to/from WTF format."""
@@ -27,46 +127,166 @@ class AssemblyAIConverter(ToWTFConverter, FromWTFConverter):
     def __init__(self) -> None:
         self.provider_name = "assemblyai"
 
-    def convert_to_wtf(self, assemblyai_data: Dict[str, Any]) -> WTFDocument:
+    def convert_to_wtf(
+        self, assemblyai_data: Dict[str, Any], *, include_extensions: bool = True
+    ) -> WTFDocument:
         """
         Convert AssemblyAI JSON data to WTF format.
 
         Args:
             assemblyai_data: AssemblyAI JSON data structure
+            include_extensions: Copy the AssemblyAI response fields into
+                extensions["assemblyai"]; extensions are None when False
 
         Returns:
             WTF document
         """
+        # Convert words and collect their per-word values in a single pass
+        word_scan = self._scan_words(assemblyai_data.get("words", []))
+        avg_word_confidence, low_confidence_words = self._confidence_stats(word_scan.confidences)
+        total_times, avg_speaker_confidences = self._speaker_stats(word_scan)
+
+        return self._build_document(
+            assemblyai_data,
+            word_scan,
+            avg_word_confidence,
+            low_confidence_words,
+            total_times,
+            avg_speaker_confidences,
+            include_extensions,
+        )
+
+    def convert_many(
+        self, assemblyai_datas: Iterable[Dict[str, Any]], *, include_extensions: bool = True
+    ) -> List[WTFDocument]:
+        """
+        Convert several AssemblyAI JSON data structures to WTF format.
+
+        With NumPy installed, the word statistics of all inputs are computed
+        together over one set of arrays rather than per document.
+
+        Args:
+            assemblyai_datas: AssemblyAI JSON data structures
+            include_extensions: Copy the AssemblyAI response fields into
+                extensions["assemblyai"]; extensions are None when False
+
+        Returns:
+            WTF documents, in input order
+        """
+        if not NUMPY_AVAILABLE:
+            return [
+                self.convert_to_wtf(assemblyai_data, include_extensions=include_extensions)
+                for assemblyai_data in assemblyai_datas
+            ]
+
+        datas = list(assemblyai_datas)
+        if not datas:
+            return []
+        word_scans = [self._scan_words(data.get("words", [])) for data in datas]
+        word_counts = [len(word_scan.confidences) for word_scan in word_scans]
+        speaker_counts = [len(word_scan.speaker_ids) for word_scan in word_scans]
+        document_count = len(word_scans)
+        total_words = sum(word_counts)
+        total_speakers = sum(speaker_counts)
+
+        # Stage every document's per-word values in shared arrays, tagging each
+        # word with its document and giving each document's speakers their own
+        # range of codes, so one bincount covers all documents
+        confidences = np.fromiter(
+            chain.from_iterable(word_scan.confidences for word_scan in word_scans),
+            dtype=np.float64,
+            count=total_words,
+        )
+        durations = np.fromiter(
+            chain.from_iterable(word_scan.durations for word_scan in word_scans),
+            dtype=np.float64,
+            count=total_words,
+        )
+        speaker_offsets = np.cumsum([0] + speaker_counts[:-1])
+        codes = np.fromiter(
+            chain.from_iterable(word_scan.speaker_codes for word_scan in word_scans),
+            dtype=np.intp,
+            count=total_words,
+        )
+        codes += np.repeat(speaker_offsets, word_counts)
+        documents = np.repeat(np.arange(document_count), word_counts)
+
+        confidence_sums = np.bincount(documents, weights=confidences, minlength=document_count)
+        low_counts = np.bincount(documents[confidences < 0.5], minlength=document_count)
+        time_sums = np.bincount(codes, weights=durations, minlength=total_speakers)
+        speaker_confidence_sums = np.bincount(codes, weights=confidences, minlength=total_speakers)
+        speaker_word_counts = np.bincount(codes, minlength=total_speakers)
+        total_times = time_sums.tolist()
+        avg_speaker_confidences = (speaker_confidence_sums / speaker_word_counts).tolist()
+
+        wtf_docs = []
+        for data, word_scan, word_count, confidence_sum, low_count, offset, speaker_count in zip(
+            datas,
+            word_scans,
+            word_counts,
+            confidence_sums.tolist(),
+            low_counts.tolist(),
+            speaker_offsets.tolist(),
+            speaker_counts,
+        ):
+            wtf_docs.append(
+                self._build_document(
+                    data,
+                    word_scan,
+                    confidence_sum / word_count if word_count else 0.0,
+                    low_count,
+                    total_times[offset : offset + speaker_count],
+                    avg_speaker_confidences[offset : offset + speaker_count],
+                    include_extensions,
+                )
+            )
+        return wtf_docs
+
+    def _build_document(
+        self,
+        assemblyai_data: Dict[str, Any],
+        word_scan: _WordScan,
+        avg_word_confidence: float,
+        low_confidence_words: int,
+        speaker_total_times: List[float],
+        speaker_confidences: List[float],
+        include_extensions: bool,
+    ) -> WTFDocument:
+        """Assemble the WTF document from AssemblyAI data and its word statistics."""
+        words_data = assemblyai_data.get("words", [])
+        words = word_scan.words
+
         # Extract basic transcript information
         transcript = WTFTranscript(
             text=assemblyai_data.get("text", ""),
             language=self._extract_language(assemblyai_data),
             duration=assemblyai_data.get("audio_duration", 0.0),
-            confidence=self._calculate_overall_confidence(assemblyai_data),
+            confidence=(
+                avg_word_confidence if words else float(assemblyai_data.get("confidence", 0.0))
+            ),
         )
 
-        # Convert words to segments and words
-        words_data = assemblyai_data.get("words", [])
-        segments = self._convert_words_to_segments(words_data, transcript.text)
-        words = self._convert_assemblyai_words(words_data)
+        # Convert words to segments
+        segments = self._convert_words_to_segments(
+            words_data, transcript.text, transcript.confidence
+        )
 
         # Extract speaker information
-        speakers = self._extract_speakers(assemblyai_data)
+        speakers = self._extract_speakers(
+            word_scan.speaker_ids, speaker_total_times, speaker_confidences
+        )
 
-        # Create metadata
+        # Create metadata, stamping both times once when the response has no creation time
+        created_at = assemblyai_data.get("created") or self._get_timestamp()
         metadata = WTFMetadata(
-            created_at=assemblyai_data.get("created") or self._get_timestamp(),
-            processed_at=assemblyai_data.get("created") or self._get_timestamp(),
+            created_at=created_at,
+            processed_at=created_at,
             provider="assemblyai",
             model=self._extract_model_info(assemblyai_data),
             processing_time=assemblyai_data.get("processing_time"),
-            audio=WTFAudio(
-                duration=assemblyai_data.get("audio_duration", 0.0),
-                sample_rate=None,  # Not available in standard AssemblyAI response
-                channels=None,
-                format=None,
-                bitrate=None,
-            ),
+            # Sample rate, channels, format and bitrate are not available in the
+            # standard AssemblyAI response and keep their None defaults
+            audio=WTFAudio(duration=transcript.duration),
             options=self._extract_assemblyai_options(assemblyai_data),
         )
 
@@ -78,58 +298,16 @@ class AssemblyAIConverter(ToWTFConverter, FromWTFConverter):
             overlapping_speech=None,
             silence_ratio=None,
             average_confidence=transcript.confidence,
-            low_confidence_words=self._count_low_confidence_words(words),
+            low_confidence_words=low_confidence_words,
             processing_warnings=self._extract_warnings(assemblyai_data),
         )
 
         # Create extensions with AssemblyAI-specific data
-        extensions = {
-            "assemblyai": {
-                "id": assemblyai_data.get("id"),
-                "status": assemblyai_data.get("status"),
-                "language_code": assemblyai_data.get("language_code"),
-                "language_confidence": assemblyai_data.get("language_confidence"),
-                "punctuate": assemblyai_data.get("punctuate"),
-                "format_text": assemblyai_data.get("format_text"),
-                "dual_channel": assemblyai_data.get("dual_channel"),
-                "webhook_url": assemblyai_data.get("webhook_url"),
-                "webhook_status_code": assemblyai_data.get("webhook_status_code"),
-                "webhook_auth": assemblyai_data.get("webhook_auth"),
-                "webhook_auth_header_name": assemblyai_data.get("webhook_auth_header_name"),
-                "auto_highlights": assemblyai_data.get("auto_highlights"),
-                "audio_start_from": assemblyai_data.get("audio_start_from"),
-                "audio_end_at": assemblyai_data.get("audio_end_at"),
-                "word_boost": assemblyai_data.get("word_boost"),
-                "boost_param": assemblyai_data.get("boost_param"),
-                "filter_profanity": assemblyai_data.get("filter_profanity"),
-                "redact_pii": assemblyai_data.get("redact_pii"),
-                "redact_pii_audio": assemblyai_data.get("redact_pii_audio"),
-                "redact_pii_audio_quality": assemblyai_data.get("redact_pii_audio_quality"),
-                "redact_pii_policies": assemblyai_data.get("redact_pii_policies"),
-                "redact_pii_sub": assemblyai_data.get("redact_pii_sub"),
-                "speaker_labels": assemblyai_data.get("speaker_labels"),
-                "speakers_expected": assemblyai_data.get("speakers_expected"),
-                "content_safety": assemblyai_data.get("content_safety"),
-                "content_safety_confidence": assemblyai_data.get("content_safety_confidence"),
-                "iab_categories": assemblyai_data.get("iab_categories"),
-                "iab_categories_result": assemblyai_data.get("iab_categories_result"),
-                "language_detection": assemblyai_data.get("language_detection"),
-                "custom_spelling": assemblyai_data.get("custom_spelling"),
-                "disfluencies": assemblyai_data.get("disfluencies"),
-                "sentiment_analysis": assemblyai_data.get("sentiment_analysis"),
-                "sentiment_analysis_results": assemblyai_data.get("sentiment_analysis_results"),
-                "auto_chapters": assemblyai_data.get("auto_chapters"),
-                "auto_chapters_result": assemblyai_data.get("auto_chapters_result"),
-                "summarization": assemblyai_data.get("summarization"),
-                "summarization_model": assemblyai_data.get("summarization_model"),
-                "summary_type": assemblyai_data.get("summary_type"),
-                "summary_model": assemblyai_data.get("summary_model"),
-                "custom_topics": assemblyai_data.get("custom_topics"),
-                "topics": assemblyai_data.get("topics"),
-                "speech_model": assemblyai_data.get("speech_model"),
-                "speech_model_version": assemblyai_data.get("speech_model_version"),
-            }
-        }
+        extensions = (
+            {"assemblyai": {key: assemblyai_data.get(key) for key in _EXTENSION_KEYS}}
+            if include_extensions
+            else None
+        )
 
         return WTFDocument(
             transcript=transcript,
@@ -155,17 +333,16 @@ class AssemblyAIConverter(ToWTFConverter, FromWTFConverter):
             AssemblyAI JSON data structure
         """
         # Convert words back to AssemblyAI format
-        words = []
-        if wtf_doc.words:
-            for word in wtf_doc.words:
-                word_data = {
-                    "text": word.text,
-                    "start": word.start,
-                    "end": word.end,
-                    "confidence": word.confidence,
-                    "speaker": word.speaker if word.speaker is not None else "A",
-                }
-                words.append(word_data)
+        words = [
+            {
+                "text": text,
+                "start": start,
+                "end": end,
+                "confidence": confidence,
+                "speaker": speaker if speaker is not None else "A",
+            }
+            for text, start, end, confidence, speaker in map(_WTF_WORD_FIELDS, wtf_doc.words or ())
+        ]
 
         # Extract AssemblyAI-specific extensions
         assemblyai_ext = wtf_doc.extensions.get("assemblyai", {}) if wtf_doc.extensions else {}
@@ -189,15 +366,39 @@ class AssemblyAIConverter(ToWTFConverter, FromWTFConverter):
             "speech_model_version": assemblyai_ext.get("speech_model_version", "1.0"),
         }
 
+    def from_assemblyai_bytes(self, data: Union[bytes, str]) -> WTFDocument:
+        """
+        Parse a raw AssemblyAI JSON response and convert it to WTF format.
+
+        Args:
+            data: AssemblyAI JSON document as bytes or text
+
+        Returns:
+            WTF document
+        """
+        return self.convert_to_wtf(loads(data))
+
+    def to_assemblyai_bytes(self, wtf_doc: WTFDocument) -> bytes:
+        """
+        Convert a WTF document to serialized AssemblyAI JSON.
+
+        Args:
+            wtf_doc: WTF document
+
+        Returns:
+            AssemblyAI JSON document as UTF-8 bytes
+        """
+        return dumps(self.convert_from_wtf(wtf_doc))
+
     def convert(self, data: Any) -> Any:
         """Generic convert method - determines direction based on data type."""
-        if isinstance(data, dict) and "transcript" in data and "segments" in data:
+        if isinstance(data, WTFDocument):
+            # This is a WTF document object, convert from WTF without revalidating
+            return self.convert_from_wtf(data)
+        elif isinstance(data, dict) and "transcript" in data and "segments" in data:
             # This looks like a WTF document dict, convert from WTF
             wtf_doc = WTFDocument.model_validate(data)
             return self.convert_from_wtf(wtf_doc)
-        elif isinstance(data, WTFDocument):
-            # This is a WTF document object, convert from WTF
-            return self.convert_from_wtf(data)
         else:
             # Assume this is AssemblyAI data, convert to WTF
             return self.convert_to_wtf(data)
@@ -213,18 +414,25 @@ class AssemblyAIConverter(ToWTFConverter, FromWTFConverter):
         speech_model_version = assemblyai_data.get("speech_model_version", "1.0")
         return f"{speech_model}-{speech_model_version}"
 
-    def _calculate_overall_confidence(self, assemblyai_data: Dict[str, Any]) -> float:
-        """Calculate overall confidence from AssemblyAI data."""
-        words = assemblyai_data.get("words", [])
-        if not words:
-            return float(assemblyai_data.get("confidence", 0.0))
+    def _confidence_stats(self, confidences: List[float]) -> Tuple[float, int]:
+        """Calculate the mean and the low-confidence count of word confidences."""
+        if not confidences:
+            return 0.0, 0
+
+        if NUMPY_AVAILABLE:
+            confidence_array = np.asarray(confidences, dtype=np.float64)
+            return (
+                float(confidence_array.mean()),
+                int(np.count_nonzero(confidence_array < 0.5)),
+            )
 
-        # Calculate average confidence from words
-        confidences = [word.get("confidence", 0.0) for word in words]
-        return sum(confidences) / len(confidences) if confidences else 0.0
+        return (
+            sum(confidences) / len(confidences),
+            sum(1 for confidence in confidences if confidence < 0.5),
+        )
 
     def _convert_words_to_segments(
-        self, words_data: List[Dict[str, Any]], transcript_text: str
+        self, words_data: List[Dict[str, Any]], transcript_text: str, avg_confidence: float
     ) -> List[WTFSegment]:
         """Convert AssemblyAI words to WTF segments."""
         if not words_data:
@@ -234,10 +442,6 @@ class AssemblyAIConverter(ToWTFConverter, FromWTFConverter):
         start_time = words_data[0].get("start", 0.0)
         end_time = words_data[-1].get("end", 0.0)
 
-        # Calculate average confidence
-        confidences = [word.get("confidence", 0.0) for word in words_data]
-        avg_confidence = sum(confidences) / len(confidences) if confidences else 0.0
-
         # Get speaker (assume all words in segment have same speaker)
         speaker = words_data[0].get("speaker", "A")
 
@@ -252,60 +456,98 @@ class AssemblyAIConverter(ToWTFConverter, FromWTFConverter):
         )
         return [segment]
 
-    def _convert_assemblyai_words(self, words_data: List[Dict[str, Any]]) -> List[WTFWord]:
-        """Convert AssemblyAI words to WTF words."""
+    def _scan_words(self, words_data: List[Dict[str, Any]]) -> _WordScan:
+        """Convert AssemblyAI words to WTF words, collecting per-word values on the way."""
         words = []
+        confidences = []
+        durations = []
+        speaker_codes = []
+        codes_by_speaker: Dict[Any, int] = {}
 
         for i, word_data in enumerate(words_data):
+            try:
+                text, start, end, confidence, speaker_id = _WORD_FIELDS(word_data)
+            except KeyError:
+                # Fill in defaults for the fields this word leaves out
+                get = word_data.get
+                text = get("text", "")
+                start = get("start", 0.0)
+                end = get("end", 0.0)
+                confidence = get("confidence", 0.0)
+                speaker_id = get("speaker", "A")
+
             word = WTFWord(
                 id=i,
-                start=word_data.get("start", 0.0),
-                end=word_data.get("end", 0.0),
-                text=word_data.get("text", ""),
-                confidence=word_data.get("confidence", 0.0),
-                speaker=word_data.get("speaker", "A"),
-                is_punctuation=self._is_punctuation(word_data.get("text", "")),
+                start=start,
+                end=end,
+                text=text,
+                confidence=confidence,
+                speaker=speaker_id,
+                is_punctuation=self._is_punctuation(text),
             )
             words.append(word)
-
-        return words
+            confidences.append(word.confidence)
+            durations.append(word.end - word.start)
+
+            code = codes_by_speaker.get(speaker_id)
+            if code is None:
+                code = codes_by_speaker[speaker_id] = len(codes_by_speaker)
+            speaker_codes.append(code)
+
+        return _WordScan(words, confidences, durations, list(codes_by_speaker), speaker_codes)
+
+    def _speaker_stats(self, word_scan: _WordScan) -> Tuple[List[float], List[float]]:
+        """Calculate the total word time and mean word confidence of each speaker."""
+        speaker_count = len(word_scan.speaker_ids)
+        if not speaker_count:
+            return [], []
+
+        if NUMPY_AVAILABLE:
+            codes = np.asarray(word_scan.speaker_codes, dtype=np.intp)
+            time_sums = np.bincount(codes, weights=word_scan.durations, minlength=speaker_count)
+            confidence_sums = np.bincount(
+                codes, weights=word_scan.confidences, minlength=speaker_count
+            )
+            word_counts = np.bincount(codes, minlength=speaker_count)
+            return time_sums.tolist(), (confidence_sums / word_counts).tolist()
+
+        total_times = [0.0] * speaker_count
+        confidence_totals = [0.0] * speaker_count
+        word_totals = [0] * speaker_count
+        for code, duration, confidence in zip(
+            word_scan.speaker_codes, word_scan.durations, word_scan.confidences
+        ):
+            total_times[code] += duration
+            confidence_totals[code] += confidence
+            word_totals[code] += 1
+        avg_confidences = [
+            confidence_total / word_total
+            for confidence_total, word_total in zip(confidence_totals, word_totals)
+        ]
+        return total_times, avg_confidences
 
     def _extract_speakers(
-        self, assemblyai_data: Dict[str, Any]
+        self, speaker_ids: List[Any], total_times: List[float], confidences: List[float]
     ) -> Optional[Dict[str, WTFSpeaker]]:
-        """Extract speaker information from AssemblyAI data."""
-        words = assemblyai_data.get("words", [])
-        if not words:
+        """Build WTF speakers from each speaker's total word time and mean confidence."""
+        if not speaker_ids:
             return None
 
-        # Group words by speaker
-        speaker_words: dict[str, list[Dict[str, Any]]] = {}
-        for word_data in words:
-            speaker_id = word_data.get("speaker", "A")
-            if speaker_id not in speaker_words:
-                speaker_words[speaker_id] = []
-            speaker_words[speaker_id].append(word_data)
-
-        # Create speaker objects
         speakers = {}
-        for speaker_id, words in speaker_words.items():
-            total_time = sum(word.get("end", 0.0) - word.get("start", 0.0) for word in words)
-            avg_confidence = sum(word.get("confidence", 0.0) for word in words) / len(words)
-
-            speaker = WTFSpeaker(
+        for speaker_id, total_time, confidence in zip(speaker_ids, total_times, confidences):
+            speakers[str(speaker_id)] = WTFSpeaker(
                 id=speaker_id,
                 label=f"Speaker {speaker_id}",
                 segments=[],  # Will be populated by segment processing
                 total_time=total_time,
-                confidence=avg_confidence,
+                confidence=confidence,
             )
-            speakers[str(speaker_id)] = speaker
 
-        return speakers if speakers else None
+        return speakers
 
     def _is_punctuation(self, word: str) -> bool:
-        """Check if a word is punctuation."""
-        return word.strip() in ".,!?;:()[]{}'\"-"
+        """Check if a word is a single punctuation mark."""
+        return word.strip() in _PUNCTUATION_MARKS
 
     def _get_timestamp(self) -> str:
         """Get current timestamp in ISO 8601 format."""
@@ -313,34 +555,12 @@ class AssemblyAIConverter(ToWTFConverter, FromWTFConverter):
 
     def _extract_assemblyai_options(self, assemblyai_data: Dict[str, Any]) -> Dict[str, Any]:
         """Extract AssemblyAI-specific options."""
-        return {
-            "punctuate": assemblyai_data.get("punctuate", True),
-            "format_text": assemblyai_data.get("format_text", True),
-            "dual_channel": assemblyai_data.get("dual_channel", False),
-            "speaker_labels": assemblyai_data.get("speaker_labels", True),
-            "speakers_expected": assemblyai_data.get("speakers_expected", 1),
-            "speech_model": assemblyai_data.get("speech_model", "best"),
-            "auto_highlights": assemblyai_data.get("auto_highlights", False),
-            "filter_profanity": assemblyai_data.get("filter_profanity", False),
-            "redact_pii": assemblyai_data.get("redact_pii", False),
-            "sentiment_analysis": assemblyai_data.get("sentiment_analysis", False),
-            "auto_chapters": assemblyai_data.get("auto_chapters", False),
-            "summarization": assemblyai_data.get("summarization", False),
-        }
+        return {key: assemblyai_data.get(key, default) for key, default in _OPTION_DEFAULTS}
 
     def _assess_audio_quality(self, assemblyai_data: Dict[str, Any]) -> str:
         """Assess audio quality based on AssemblyAI metrics."""
         confidence = assemblyai_data.get("confidence", 0.0)
-        if confidence >= 0.9:
-            return "high"
-        elif confidence >= 0.7:
-            return "medium"
-        else:
-            return "low"
-
-    def _count_low_confidence_words(self, words: List[WTFWord]) -> int:
-        """Count words with low confidence scores."""
-        return sum(1 for word in words if word.confidence < 0.5)
+        return _AUDIO_QUALITY_TIERS[bisect_right(_AUDIO_QUALITY_CUTOFFS, confidence)]
 
     def _extract_warnings(self, assemblyai_data: Dict[str, Any]) -> List[str]:
         """Extract processing warnings from AssemblyAI data."""
@@ -6,6 +6,7 @@ confidence score normalization, language code validation, and more.
 """
 
 from .confidence_utils import calculate_quality_metrics, normalize_confidence
+from .json_utils import canonical_dumps, dumps, load_file, loads
 from .language_utils import is_valid_bcp47, normalize_language_code
 from .time_utils import convert_timestamp, validate_timing
 
@@ -16,4 +17,8 @@ __all__ = [
     "calculate_quality_metrics",
     "is_valid_bcp47",
     "normalize_language_code",
+    "loads",
+    "load_file",
+    "dumps",
+    "canonical_dumps",
 ]
@@ -0,0 +1,95 @@
+"""
+JSON utility functions for WTF transcript converter.
+
+This module provides JSON parsing and serialization helpers that use orjson
+when it is installed and fall back to the standard library otherwise.
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Union
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+    # Serialization options shared by every dumps() call
+    _ORJSON_DUMPS_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+    _ORJSON_CANONICAL_OPTIONS = orjson.OPT_SORT_KEYS
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """
+    Parse JSON data into Python objects.
+
+    Args:
+        data: Raw JSON document as bytes or text
+
+    Returns:
+        Parsed Python object
+
+    Raises:
+        json.JSONDecodeError: If the data is not valid JSON
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def load_file(path: Union[str, Path]) -> Any:
+    """
+    Read and parse a JSON file.
+
+    The file is read as raw bytes and handed straight to the parser, skipping
+    a separate text-mode decoding pass.
+
+    Args:
+        path: Path to the JSON file
+
+    Returns:
+        Parsed Python object
+
+    Raises:
+        OSError: If the file cannot be read
+        json.JSONDecodeError: If the file is not valid JSON
+    """
+    return loads(Path(path).read_bytes())
+
+
+def dumps(obj: Any) -> bytes:
+    """
+    Serialize a Python object to indented UTF-8 encoded JSON.
+
+    Args:
+        obj: Object to serialize
+
+    Returns:
+        JSON document as UTF-8 bytes
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=_ORJSON_DUMPS_OPTIONS)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def canonical_dumps(obj: Any) -> bytes:
+    """
+    Serialize a Python object to compact JSON with sorted keys.
+
+    Equal objects serialize to equal bytes within a process, so the result can
+    be used as a cache key. The output differs between the orjson and standard
+    library paths and is not meant to be stored.
+
+    Args:
+        obj: Object to serialize
+
+    Returns:
+        JSON document as UTF-8 bytes
+
+    Raises:
+        TypeError: If the object is not JSON serializable
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=_ORJSON_CANONICAL_OPTIONS)
+    return json.dumps(obj, sort_keys=True, separators=(",", ":")).encode("utf-8")
@@ -5,6 +5,35 @@ This module provides utilities for language code validation and normalization.
 """
 
 import re
+from functools import lru_cache
+
+# Full language names and their default language code
+_FULL_NAMES = {
+    "english": "en-US",
+    "spanish": "es-ES",
+    "french": "fr-FR",
+    "german": "de-DE",
+    "italian": "it-IT",
+    "portuguese": "pt-BR",
+    "chinese": "zh-CN",
+    "japanese": "ja-JP",
+    "korean": "ko-KR",
+    "russian": "ru-RU",
+}
+
+# Bare language codes and their default region
+_VARIATIONS = {
+    "en": "en-US",
+    "es": "es-ES",
+    "fr": "fr-FR",
+    "de": "de-DE",
+    "it": "it-IT",
+    "pt": "pt-BR",
+    "zh": "zh-CN",
+    "ja": "ja-JP",
+    "ko": "ko-KR",
+    "ru": "ru-RU",
+}
 
 
 def is_valid_bcp47(language_code: str) -> bool:
@@ -23,10 +52,13 @@ def is_valid_bcp47(language_code: str) -> bool:
     return bool(re.match(pattern, language_code.lower()))
 
 
+@lru_cache(maxsize=512)
 def normalize_language_code(language_code: str) -> str:
     """
     Normalize language code to standard format.
 
+    Results are cached, since conversions see the same few codes over and over.
+
     Args:
         language_code: Language code to normalize
 
@@ -39,34 +71,7 @@ def normalize_language_code(language_code: str) -> str:
     # Handle underscore format (en_us -> en-US)
     normalized = normalized.replace("_", "-")
 
-    # Handle full language names
-    full_names = {
-        "english": "en-US",
-        "spanish": "es-ES",
-        "french": "fr-FR",
-        "german": "de-DE",
-        "italian": "it-IT",
-        "portuguese": "pt-BR",
-        "chinese": "zh-CN",
-        "japanese": "ja-JP",
-        "korean": "ko-KR",
-        "russian": "ru-RU",
-    }
-    if normalized in full_names:
-        return full_names[normalized]
-
-    # Handle common variations
-    variations = {
-        "en": "en-US",
-        "es": "es-ES",
-        "fr": "fr-FR",
-        "de": "de-DE",
-        "it": "it-IT",
-        "pt": "pt-BR",
-        "zh": "zh-CN",
-        "ja": "ja-JP",
-        "ko": "ko-KR",
-        "ru": "ru-RU",
-    }
-
-    return variations.get(normalized, normalized)
+    # Handle full language names, then common variations
+    if normalized in _FULL_NAMES:
+        return _FULL_NAMES[normalized]
+    return _VARIATIONS.get(normalized, normalized)
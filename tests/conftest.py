@@ -6,7 +6,8 @@ This module contains shared fixtures and configuration for the test suite.
 
 import json
 from pathlib import Path
-from typing import Any, Dict
+from types import ModuleType
+from typing import Any, Callable, Dict
 
 import pytest
 
@@ -159,3 +160,22 @@ def fixtures_dir() -> Path:
 def temp_output_dir(tmp_path: Path) -> Path:
     """Temporary directory for test outputs."""
     return tmp_path / "output"
+
+
+@pytest.fixture(params=[True, False], ids=["numpy", "no-numpy"])
+def set_numpy(
+    request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch
+) -> Callable[[ModuleType], None]:
+    """
+    Run a test with and without NumPy.
+
+    Call the returned function with the module under test to set its
+    NUMPY_AVAILABLE flag; the NumPy run is skipped when NumPy is not installed.
+    """
+
+    def set_numpy_available(module: ModuleType) -> None:
+        if request.param and not module.NUMPY_AVAILABLE:
+            pytest.skip("NumPy not installed")
+        monkeypatch.setattr(module, "NUMPY_AVAILABLE", request.param)
+
+    return set_numpy_available
@@ -1,8 +1,13 @@
 """Tests for the cross-provider CLI module."""
 
+from types import SimpleNamespace
+
 from click.testing import CliRunner
 
 from wtf_transcript_converter.cli.cross_provider import (
+    _consistency_row,
+    _run_consistency,
+    _write_report,
     all,
     consistency,
     cross_provider,
@@ -59,6 +64,78 @@ class TestCrossProviderCLI:
         assert "Running comprehensive cross-provider analysis" in result.output
         assert "Comprehensive cross-provider analysis complete" in result.output
 
+    def test_all_tests_command_writes_reports(self, tmp_path):
+        """Test all command runs every analysis and saves each report."""
+        result = self.runner.invoke(
+            all, ["tests/fixtures/whisper_sample.json", "-o", str(tmp_path), "-i", "1"]
+        )
+
+        assert result.exit_code == 0
+        assert "test failed" not in result.output
+        assert "Consistency Summary" in result.output
+        assert "Performance Summary" in result.output
+        assert "Quality Summary" in result.output
+        for name in ("consistency", "performance", "quality"):
+            assert (tmp_path / f"{name}_report.json").exists()
+
+    def test_report_only_generated_when_needed(self):
+        """Test the text report is skipped unless it will be shown or saved."""
+        from wtf_transcript_converter.utils.json_utils import loads
+
+        with open("tests/fixtures/whisper_sample.json", "rb") as f:
+            input_data = loads(f.read())
+
+        _, _, report = _run_consistency(input_data, include_report=False)
+        assert report is None
+
+        _, _, report = _run_consistency(input_data, include_report=True)
+        assert "CROSS-PROVIDER CONSISTENCY REPORT" in report
+
+    def test_consistency_verbose_shows_report(self):
+        """Test verbose consistency output includes the full report."""
+        result = self.runner.invoke(consistency, ["tests/fixtures/whisper_sample.json", "-v"])
+
+        assert result.exit_code == 0
+        assert "CROSS-PROVIDER CONSISTENCY REPORT" in result.output
+
+    def test_write_report_matches_single_dump(self, tmp_path):
+        """Test the streamed report is identical to dumping it in one call."""
+        from wtf_transcript_converter.utils.json_utils import dumps
+
+        results = [
+            SimpleNamespace(
+                provider="whisper",
+                is_valid=True,
+                confidence_score=0.9,
+                word_count=3,
+                segment_count=1,
+                duration=1.5,
+                validation_errors=[],
+            ),
+            SimpleNamespace(
+                provider="deepgram",
+                is_valid=False,
+                confidence_score=0.0,
+                word_count=0,
+                segment_count=0,
+                duration=0.0,
+                validation_errors=["Conversion failed:\nbad input"],
+            ),
+        ]
+        analysis = {"status": "inconsistent", "metrics": {"confidence": {"values": [0.9]}}}
+        report = "REPORT\nline two"
+
+        for rows in (results, []):
+            output = tmp_path / "report.json"
+            _write_report(str(output), analysis, rows, report, _consistency_row)
+
+            expected = {
+                "analysis": analysis,
+                "results": [_consistency_row(r) for r in rows],
+                "report": report,
+            }
+            assert output.read_bytes() == dumps(expected)
+
     def test_consistency_missing_file(self):
         """Test consistency command with missing file."""
         result = self.runner.invoke(consistency, ["nonexistent.json"])
@@ -1,10 +1,23 @@
 """Tests for the main CLI module."""
 
+import shutil
+import subprocess
+import sys
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 from click.testing import CliRunner
 
-from wtf_transcript_converter.cli.main import from_wtf, main, providers, to_wtf, validate
+from wtf_transcript_converter.cli.main import (
+    _detect_provider,
+    _get_converter,
+    batch,
+    from_wtf,
+    main,
+    providers,
+    to_wtf,
+    validate,
+)
 
 
 class TestMainCLI:
@@ -32,7 +45,14 @@ class TestMainCLI:
         assert "canary" in result.output
         assert "parakeet" in result.output
 
-    @patch("wtf_transcript_converter.cli.main.WhisperConverter")
+    def test_providers_command_repeated(self):
+        """Test the cached providers table renders on repeated calls."""
+        first = self.runner.invoke(providers)
+        second = self.runner.invoke(providers)
+        assert second.exit_code == 0
+        assert second.output == first.output
+
+    @patch("wtf_transcript_converter.providers.whisper.WhisperConverter")
     def test_to_wtf_whisper(self, mock_converter):
         """Test converting Whisper format to WTF."""
         mock_instance = MagicMock()
@@ -46,7 +66,7 @@ class TestMainCLI:
         assert result.exit_code == 0
         mock_instance.convert_to_wtf.assert_called_once()
 
-    @patch("wtf_transcript_converter.cli.main.WhisperConverter")
+    @patch("wtf_transcript_converter.providers.whisper.WhisperConverter")
     def test_from_wtf_whisper(self, mock_converter):
         """Test converting WTF format to Whisper."""
         mock_instance = MagicMock()
@@ -61,6 +81,40 @@ class TestMainCLI:
         assert result.exit_code == 0
         mock_instance.convert_from_wtf.assert_called_once()
 
+    def test_to_wtf_writes_wtf_document(self, tmp_path):
+        """Test to-wtf writes a WTF document that validates on reload."""
+        from wtf_transcript_converter.core.models import WTFDocument
+
+        output = tmp_path / "sample.wtf.json"
+        result = self.runner.invoke(
+            to_wtf, ["tests/fixtures/whisper_sample.json", "-p", "whisper", "-o", str(output)]
+        )
+
+        assert result.exit_code == 0
+        wtf_doc = WTFDocument.model_validate_json(output.read_text(encoding="utf-8"))
+        assert wtf_doc.metadata.provider == "whisper"
+
+    def test_to_wtf_verbose_summary(self, tmp_path):
+        """Test to-wtf verbose output includes the document summary."""
+        output = tmp_path / "sample.wtf.json"
+        result = self.runner.invoke(
+            to_wtf,
+            ["tests/fixtures/whisper_sample.json", "-p", "whisper", "-o", str(output), "-v"],
+        )
+
+        assert result.exit_code == 0
+        assert "Duration: 8.5s" in result.output
+        assert "Segments: 2" in result.output
+        assert "Confidence: 0.82" in result.output
+
+    def test_get_converter(self):
+        """Test converter lookup by provider name."""
+        from wtf_transcript_converter.providers import RevAIConverter, WhisperConverter
+
+        assert isinstance(_get_converter("whisper"), WhisperConverter)
+        assert isinstance(_get_converter("Rev-AI"), RevAIConverter)
+        assert _get_converter("invalid") is None
+
     def test_to_wtf_invalid_provider(self):
         """Test to-wtf with invalid provider."""
         result = self.runner.invoke(
@@ -111,3 +165,71 @@ class TestMainCLI:
         )
 
         assert result.exit_code != 0
+
+    def test_cli_import_does_not_load_providers(self):
+        """Test importing the CLI does not import provider modules."""
+        code = (
+            "import sys, wtf_transcript_converter.cli.main; "
+            "print(any(m.startswith('wtf_transcript_converter.providers.') for m in sys.modules))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.strip() == "False"
+
+    def test_detect_provider(self):
+        """Test provider auto-detection on the sample fixtures."""
+        from wtf_transcript_converter.utils.json_utils import loads
+
+        fixtures = Path("tests/fixtures")
+        for name, expected in [
+            ("whisper", "whisper"),
+            ("deepgram", "deepgram"),
+            ("assemblyai", "assemblyai"),
+            ("rev_ai", "rev-ai"),
+            ("canary", "canary"),
+            ("parakeet", "parakeet"),
+        ]:
+            data = loads((fixtures / f"{name}_sample.json").read_bytes())
+            assert _detect_provider(data) == expected
+
+        assert _detect_provider(loads((fixtures / "wtf_sample.json").read_bytes())) is None
+
+    def test_batch_auto_detect(self, tmp_path):
+        """Test batch converting files with provider auto-detection."""
+        input_dir = tmp_path / "in"
+        output_dir = tmp_path / "out"
+        input_dir.mkdir()
+        for name in ("whisper_sample.json", "deepgram_sample.json"):
+            shutil.copy(Path("tests/fixtures") / name, input_dir / name)
+
+        result = self.runner.invoke(
+            batch, ["-i", str(input_dir), "-o", str(output_dir), "-p", "auto"]
+        )
+
+        assert result.exit_code == 0
+        assert "2 succeeded, 0 failed" in result.output
+        assert (output_dir / "whisper_sample.wtf.json").exists()
+        assert (output_dir / "deepgram_sample.wtf.json").exists()
+
+    def test_batch_reports_failures(self, tmp_path):
+        """Test batch reports files that cannot be converted."""
+        shutil.copy("tests/fixtures/invalid.json", tmp_path / "invalid.json")
+
+        result = self.runner.invoke(
+            batch, ["-i", str(tmp_path), "-o", str(tmp_path / "out"), "-p", "whisper"]
+        )
+
+        assert result.exit_code == 0
+        assert "Failed to convert" in result.output
+        assert "0 succeeded, 1 failed" in result.output
+
+    def test_batch_invalid_provider(self, tmp_path):
+        """Test batch with invalid provider."""
+        result = self.runner.invoke(
+            batch, ["-i", str(tmp_path), "-o", str(tmp_path / "out"), "-p", "invalid"]
+        )
+
+        assert result.exit_code == 0
+        assert "Unsupported provider 'invalid'" in result.output
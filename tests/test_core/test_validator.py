@@ -0,0 +1,221 @@
+"""Tests for WTF document validation."""
+
+import pytest
+
+from wtf_transcript_converter.core.models import (
+    WTFAudio,
+    WTFDocument,
+    WTFMetadata,
+    WTFSegment,
+    WTFSpeaker,
+    WTFTranscript,
+    WTFWord,
+)
+from wtf_transcript_converter.core.validator import (
+    validate_timestamp,
+    validate_wtf_document,
+    validate_wtf_document_iter,
+)
+
+
+def _make_document(segments, words=None, speakers=None, text=None, duration=None):
+    """Build a document without running the model validators."""
+    if text is None:
+        text = " ".join(seg.text for seg in segments)
+    if duration is None:
+        duration = max((seg.end for seg in segments), default=0.0)
+
+    transcript = WTFTranscript.model_construct(
+        text=text, language="en-us", duration=duration, confidence=0.9
+    )
+    metadata = WTFMetadata(
+        created_at="2025-01-02T12:00:00Z",
+        processed_at="2025-01-02T12:00:15Z",
+        provider="test",
+        model="test-model",
+        audio=WTFAudio(duration=duration),
+    )
+    return WTFDocument.model_construct(
+        transcript=transcript,
+        segments=segments,
+        metadata=metadata,
+        words=words,
+        speakers=speakers,
+    )
+
+
+def _segment(id, start, end, text, **kwargs):
+    """Build a segment without running the model validators."""
+    fields = {"confidence": 0.9, "speaker": None, "words": None}
+    fields.update(kwargs)
+    return WTFSegment.model_construct(id=id, start=start, end=end, text=text, **fields)
+
+
+def _word(id, start, end, text, **kwargs):
+    """Build a word without running the model validators."""
+    fields = {"confidence": 0.9, "speaker": None, "is_punctuation": None}
+    fields.update(kwargs)
+    return WTFWord.model_construct(id=id, start=start, end=end, text=text, **fields)
+
+
+class TestValidateWTFDocument:
+    """Test validate_wtf_document."""
+
+    def test_valid_document(self):
+        """Test a consistent document has no errors."""
+        words = [_word(0, 0.0, 0.5, "Hello", speaker=0), _word(1, 0.5, 1.0, "world", speaker=0)]
+        segments = [_segment(0, 0.0, 1.0, "Hello world", speaker=0, words=[0, 1])]
+        speakers = {
+            "0": WTFSpeaker(id=0, label="Speaker 0", segments=[0], total_time=1.0, confidence=0.9)
+        }
+
+        is_valid, errors = validate_wtf_document(_make_document(segments, words, speakers))
+
+        assert is_valid
+        assert errors == []
+
+    def test_segment_timing_and_overlap(self):
+        """Test invalid segment timing and overlapping segments are reported."""
+        segments = [_segment(0, 0.0, 2.0, "Hello"), _segment(1, 1.5, 1.0, "world")]
+
+        is_valid, errors = validate_wtf_document(_make_document(segments, duration=2.0))
+
+        assert not is_valid
+        assert "Segment 1: start time (1.5) must be before end time (1.0)" in errors
+        assert "Segments 0 and 1 have overlapping times" in errors
+
+    def test_transcript_mismatch(self):
+        """Test transcript text and duration are checked against segments."""
+        segments = [_segment(0, 0.0, 1.0, "Hello")]
+
+        _, errors = validate_wtf_document(_make_document(segments, text="Goodbye", duration=10.0))
+
+        assert "Transcript text does not match concatenated segment text" in errors
+        assert "Transcript duration (10.0) does not match segment timing (1.0)" in errors
+
+    def test_transcript_text_with_unstripped_segments(self):
+        """Test text comparison strips the joined segment text."""
+        segments = [_segment(0, 0.0, 1.0, " Hello"), _segment(1, 1.0, 2.0, "world ")]
+
+        is_valid, errors = validate_wtf_document(_make_document(segments, text="Hello world"))
+
+        assert is_valid, errors
+
+    def test_invalid_speakers(self):
+        """Test segment and word speakers must exist in the speakers map."""
+        words = [_word(0, 0.0, 1.0, "Hello", speaker="B")]
+        segments = [_segment(0, 0.0, 1.0, "Hello", speaker=1)]
+        speakers = {
+            "0": WTFSpeaker(id=0, label="Speaker 0", segments=[0], total_time=1.0, confidence=0.9)
+        }
+
+        _, errors = validate_wtf_document(_make_document(segments, words, speakers))
+
+        assert "Segment 0 references invalid speaker 1" in errors
+        assert "Word 0 references invalid speaker B" in errors
+
+    def test_word_segment_references(self):
+        """Test segment word references must exist and fall within the segment."""
+        words = [_word(0, 0.0, 0.5, "Hello"), _word(1, 0.5, 3.0, "world")]
+        segments = [_segment(0, 0.0, 1.0, "Hello world", words=[0, 1, 7])]
+
+        _, errors = validate_wtf_document(_make_document(segments, words))
+
+        assert "Word 1 timing is outside segment 0 timing" in errors
+        assert "Segment 0 references invalid word 7" in errors
+        assert not any("Word 0" in error for error in errors)
+
+    def test_duplicate_word_ids_use_first_word(self):
+        """Test segment word references resolve to the first word with that ID."""
+        words = [_word(0, 0.0, 1.0, "Hello"), _word(0, 5.0, 6.0, "again")]
+        segments = [_segment(0, 0.0, 1.0, "Hello", words=[0])]
+
+        _, errors = validate_wtf_document(_make_document(segments, words))
+
+        assert "Word 0 timing is outside segment 0 timing" not in errors
+
+    def test_confidence_out_of_range(self):
+        """Test out-of-range confidence scores are reported."""
+        words = [_word(3, 0.0, 1.0, "Hello", confidence=1.5)]
+        segments = [_segment(0, 0.0, 1.0, "Hello", confidence=-0.1)]
+
+        _, errors = validate_wtf_document(_make_document(segments, words))
+
+        assert "Segment 0 confidence (-0.1) must be between 0.0 and 1.0" in errors
+        assert "Word 3 confidence (1.5) must be between 0.0 and 1.0" in errors
+
+    def test_max_errors(self):
+        """Test validation stops once max_errors errors have been collected."""
+        segments = [_segment(i, 0.0, 1.0, "x", confidence=2.0) for i in range(60)]
+        document = _make_document(segments)
+
+        is_valid, errors = validate_wtf_document(document, max_errors=5)
+        assert not is_valid
+        assert len(errors) == 5
+
+        _, all_errors = validate_wtf_document(document)
+        assert len(all_errors) == 100
+
+        is_valid, errors = validate_wtf_document(document, max_errors=1)
+        assert not is_valid
+        assert errors == ["Segment 0 confidence (2.0) must be between 0.0 and 1.0"]
+
+    @pytest.mark.parametrize("max_errors", [0, -1])
+    def test_max_errors_must_be_positive(self, max_errors):
+        """Test a max_errors below 1 is rejected rather than passing invalid documents."""
+        segments = [_segment(0, 0.0, 1.0, "x", confidence=2.0)]
+
+        with pytest.raises(ValueError, match="max_errors must be at least 1"):
+            validate_wtf_document(_make_document(segments), max_errors=max_errors)
+
+    def test_iter_is_lazy(self):
+        """Test the error iterator yields errors on demand."""
+        segments = [_segment(i, 0.0, 1.0, "x", confidence=2.0) for i in range(10)]
+        errors = validate_wtf_document_iter(_make_document(segments))
+
+        assert next(errors) == "Segment 0 confidence (2.0) must be between 0.0 and 1.0"
+        assert next(errors) == "Segments 0 and 1 have overlapping times"
+
+    def test_iter_empty_for_valid_document(self):
+        """Test the error iterator is empty for a valid document."""
+        segments = [_segment(0, 0.0, 1.0, "Hello")]
+        assert not any(validate_wtf_document_iter(_make_document(segments)))
+
+    def test_overlapping_segments_are_reported_not_rejected(self):
+        """Test overlapping segments build a document and fail validation."""
+        document = WTFDocument(
+            transcript=WTFTranscript(
+                text="Hello world", language="en-US", duration=2.0, confidence=0.9
+            ),
+            segments=[
+                WTFSegment(id=0, start=0.0, end=1.5, text="Hello", confidence=0.9),
+                WTFSegment(id=1, start=1.0, end=2.0, text="world", confidence=0.9),
+            ],
+            metadata=WTFMetadata(
+                created_at="2025-01-02T12:00:00Z",
+                processed_at="2025-01-02T12:00:15Z",
+                provider="test",
+                model="test-model",
+                audio=WTFAudio(duration=2.0),
+            ),
+        )
+
+        is_valid, errors = validate_wtf_document(document)
+
+        assert not is_valid
+        assert errors == ["Segments 0 and 1 have overlapping times"]
+
+
+class TestValidateTimestamp:
+    """Test validate_timestamp."""
+
+    def test_valid_timestamps(self):
+        """Test UTC designator and offset timestamps are accepted."""
+        assert validate_timestamp("2025-01-02T12:00:00Z")
+        assert validate_timestamp("2025-01-02T12:00:00.123456Z")
+        assert validate_timestamp("2025-01-02T12:00:00+00:00")
+
+    def test_invalid_timestamp(self):
+        """Test malformed timestamps are rejected."""
+        assert not validate_timestamp("2025-13-02T12:00:00Z")
+        assert not validate_timestamp("not a timestamp")
@@ -391,3 +391,56 @@ class TestCrossProviderConsistency:
         word_metrics = analysis["metrics"]["word_count"]
         assert word_metrics["mean"] == pytest.approx(10.0, abs=0.1)
         assert len(word_metrics["values"]) == 3
+
+
+class TestPackagedConsistencyTester:
+    """Test the packaged consistency tester."""
+
+    def test_calculate_mean_std(self, set_numpy):
+        """Test mean and sample standard deviation with and without NumPy."""
+        from wtf_transcript_converter.cross_provider import consistency
+
+        set_numpy(consistency)
+        tester = consistency.CrossProviderConsistencyTester()
+
+        mean, std = tester._calculate_mean_std([2, 4, 4, 4, 5, 5, 7, 9])
+        assert mean == pytest.approx(5.0)
+        assert std == pytest.approx(2.138089935)
+
+        assert tester._calculate_mean_std([0.8]) == (pytest.approx(0.8), 0.0)
+        assert tester._calculate_mean_std([]) == (0.0, 0.0)
+        assert tester._calculate_std([1.0, 3.0]) == pytest.approx(1.414213562)
+
+    def test_threaded_conversion_matches_sequential(self):
+        """Test threaded conversion returns the same results in provider order."""
+        from wtf_transcript_converter.cross_provider.consistency import (
+            CrossProviderConsistencyTester as PackagedTester,
+        )
+        from wtf_transcript_converter.utils.json_utils import load_file
+
+        sample_data = load_file("tests/fixtures/whisper_sample.json")
+        tester = PackagedTester()
+
+        sequential = tester.test_consistency_with_sample_data(sample_data)
+        threaded = tester.test_consistency_with_sample_data(sample_data, max_workers=3)
+
+        assert [r.provider for r in threaded] == list(tester.providers)
+        assert [(r.provider, r.is_valid, r.word_count) for r in threaded] == [
+            (r.provider, r.is_valid, r.word_count) for r in sequential
+        ]
+
+    def test_providers_instantiated_lazily(self):
+        """Test converters are only created when a provider is first used."""
+        from wtf_transcript_converter.cross_provider.consistency import (
+            CrossProviderConsistencyTester as PackagedTester,
+        )
+
+        tester = PackagedTester()
+
+        assert "whisper" in tester.providers
+        assert len(tester.providers) == 6
+        assert tester.providers._instances == {}
+
+        whisper = tester.providers["whisper"]
+        assert tester.providers["whisper"] is whisper
+        assert list(tester.providers._instances) == ["whisper"]
@@ -1,11 +1,13 @@
 """Integration tests for cross-provider performance testing."""
 
+import io
 import json
 from pathlib import Path
 
 import pytest
 
 from wtf_transcript_converter.cross_provider.performance import PerformanceBenchmark
+from wtf_transcript_converter.cross_provider.registry import LazyProviderMap
 
 
 class TestPerformanceBenchmarkIntegration:
@@ -71,6 +73,73 @@ class TestPerformanceBenchmarkIntegration:
                 assert hasattr(result, "memory_usage_mb")
                 assert hasattr(result, "cpu_usage_percent")
 
+    def test_benchmark_all_providers_in_processes(self):
+        """Test process-pool benchmarking returns results in provider order."""
+        minimal_data = {
+            "text": "Hello world",
+            "segments": [{"start": 0.0, "end": 1.0, "text": "Hello world"}],
+        }
+
+        results = self.benchmark.benchmark_all_providers(minimal_data, iterations=1, max_workers=2)
+
+        assert [r.provider for r in results] == list(self.benchmark.providers)
+
+    def test_benchmark_all_providers_streams_results(self):
+        """Test each result is written to the stream as a JSON line."""
+        minimal_data = {
+            "text": "Hello world",
+            "segments": [{"start": 0.0, "end": 1.0, "text": "Hello world"}],
+        }
+        stream = io.BytesIO()
+
+        results = self.benchmark.benchmark_all_providers(minimal_data, iterations=1, stream=stream)
+
+        lines = [json.loads(line) for line in stream.getvalue().splitlines()]
+        assert [line["provider"] for line in lines] == [r.provider for r in results]
+        assert [line["success"] for line in lines] == [r.success for r in results]
+
+    def test_benchmark_provider_runs_warm_up(self):
+        """Test one untimed warm-up conversion runs before the measured iterations."""
+        whisper = self.benchmark.providers["whisper"]
+        calls = []
+
+        class CountingConverter:
+            def convert(self, data):
+                calls.append(data)
+                return whisper.convert(data)
+
+        self.benchmark.providers = {"counting": CountingConverter()}
+        minimal_data = {
+            "text": "Hello world",
+            "segments": [{"start": 0.0, "end": 1.0, "text": "Hello world"}],
+        }
+
+        result = self.benchmark.benchmark_provider("counting", minimal_data, iterations=3)
+
+        assert result.success
+        assert len(calls) == 4
+        assert result.wtf_doc_size_kb > 0
+
+        calls.clear()
+        result = self.benchmark.benchmark_provider(
+            "counting", minimal_data, iterations=3, time_budget=0.0
+        )
+
+        assert result.success
+        assert len(calls) == 2
+
+    def test_benchmark_provider_with_failed_constructor(self):
+        """Test a converter that cannot be created is reported as a failure."""
+        self.benchmark.providers = LazyProviderMap({"broken": "MissingConverter"})
+
+        first = self.benchmark.benchmark_provider("broken", {"text": "test"})
+        second = self.benchmark.benchmark_provider("broken", {"text": "test"})
+
+        assert not first.success
+        assert "Failed to initialize broken" in first.error_message
+        assert second.error_message == first.error_message
+        assert "broken" in self.benchmark.providers._errors
+
     def test_benchmark_with_empty_data(self):
         """Test benchmarking with empty data."""
         empty_data = {}
@@ -172,6 +241,9 @@ class TestPerformanceBenchmarkIntegration:
         assert len(report) > 0
         assert "Performance Report" in report or "performance" in report.lower()
 
+        analysis = self.benchmark.analyze_performance(benchmark_results)
+        assert self.benchmark.generate_performance_report(benchmark_results, analysis) == report
+
     def test_benchmark_invalid_provider(self):
         """Test benchmarking with invalid provider."""
         sample_data = {"text": "test"}
@@ -184,6 +256,17 @@ class TestPerformanceBenchmarkIntegration:
         # Should still have timing metrics
         assert hasattr(result, "conversion_time")
 
+    @pytest.mark.parametrize("provider_name", ["whisper", "deepgram", "assemblyai"])
+    def test_benchmark_provider_with_wtf_sample(self, fixtures_dir, provider_name):
+        """Test a converter that returns its own format for a WTF sample fails."""
+        sample_data = json.loads((fixtures_dir / "wtf_sample.json").read_text())
+
+        result = self.benchmark.benchmark_provider(provider_name, sample_data, iterations=1)
+
+        assert not result.success
+        assert result.error_message == "Converter returned dict, not a WTFDocument"
+        assert result.wtf_doc_size_kb == 0.0
+
     def test_performance_metrics_accuracy(self):
         """Test that performance metrics are reasonable."""
         sample_data = {
@@ -598,3 +598,16 @@ class TestQualityComparison:
         completeness = quality_comparator._assess_text_completeness(wtf_doc, original_data)
         assert 0.0 <= completeness <= 1.0, "Text completeness should be between 0 and 1"
         assert completeness > 0.5, "Should have some overlap with original text"
+
+
+class TestPackagedQualityComparison(TestQualityComparison):
+    """Run the quality comparison tests against the packaged comparator."""
+
+    @pytest.fixture
+    def quality_comparator(self) -> Any:
+        """Create a packaged quality comparator instance."""
+        from wtf_transcript_converter.cross_provider.quality import (
+            QualityComparator as PackagedComparator,
+        )
+
+        return PackagedComparator()
@@ -2,6 +2,7 @@
 
 import json
 from pathlib import Path
+from types import SimpleNamespace
 
 import pytest
 
@@ -203,6 +204,9 @@ class TestQualityComparatorIntegration:
         assert len(report) > 0
         assert "Quality Report" in report or "quality" in report.lower()
 
+        analysis = self.comparator.analyze_quality_comparison(quality_results)
+        assert self.comparator.generate_quality_report(quality_results, analysis) == report
+
     def test_quality_metrics_accuracy(self):
         """Test that quality metrics are reasonable."""
         sample_data = {
@@ -275,3 +279,188 @@ class TestQualityComparatorIntegration:
         assert hasattr(result, "overall_confidence")
         assert isinstance(result.overall_confidence, (int, float))
         assert 0.0 <= result.overall_confidence <= 1.0
+
+    def test_word_confidence_stats(self, set_numpy):
+        """Test word confidence statistics with and without NumPy."""
+        from wtf_transcript_converter.cross_provider import quality
+
+        set_numpy(quality)
+
+        avg, low, high, low_count = self.comparator._word_confidence_stats([0.9, 0.4, 0.6, 0.1])
+
+        assert avg == pytest.approx(0.5)
+        assert (low, high, low_count) == (0.1, 0.9, 2)
+        assert self.comparator._word_confidence_stats([]) == (0.0, 0.0, 0.0, 0)
+
+    def test_assess_timing_accuracy_with_unordered_segments(self, set_numpy):
+        """Test word containment is checked against every segment, in any order."""
+        from wtf_transcript_converter.core.models import WTFSegment, WTFWord
+        from wtf_transcript_converter.cross_provider import quality
+
+        set_numpy(quality)
+
+        segments = [
+            WTFSegment(id=0, start=2.0, end=3.0, text="world", confidence=0.9),
+            WTFSegment(id=1, start=0.0, end=2.5, text="Hello", confidence=0.9),
+        ]
+        words = [
+            WTFWord(id=0, start=0.0, end=1.0, text="Hello", confidence=0.9),
+            WTFWord(id=1, start=2.1, end=2.9, text="world", confidence=0.9),
+        ]
+        doc = SimpleNamespace(words=words, segments=segments)
+
+        assert self.comparator._assess_timing_accuracy(doc) == pytest.approx(0.7)
+
+        words.append(WTFWord(id=2, start=2.8, end=3.5, text="again", confidence=0.9))
+        assert self.comparator._assess_timing_accuracy(doc) == pytest.approx(0.4)
+
+    def test_providers_instantiated_lazily(self, monkeypatch):
+        """Test converters are only created when a provider is first analyzed."""
+        from wtf_transcript_converter.cross_provider import quality
+
+        monkeypatch.setattr(quality, "_SHARED_CONVERTERS", {})
+        comparator = QualityComparator()
+        assert len(comparator.providers) == 6
+        assert comparator.providers._instances == {}
+
+        comparator.analyze_quality("whisper", {"text": "Hello"})
+
+        assert list(comparator.providers._instances) == ["whisper"]
+
+    def test_converters_shared_between_comparators(self):
+        """Test comparators reuse the same converter instances."""
+        other = QualityComparator()
+
+        assert other.providers["whisper"] is self.comparator.providers["whisper"]
+
+    def test_threaded_comparison_matches_sequential(self):
+        """Test threaded comparison returns the same results in provider order."""
+        sample_file = Path(__file__).parent.parent / "fixtures" / "whisper_sample.json"
+        with open(sample_file) as f:
+            sample_data = json.load(f)
+
+        sequential = self.comparator.compare_quality_across_providers(sample_data)
+        threaded = self.comparator.compare_quality_across_providers(sample_data, max_workers=3)
+
+        assert [r.provider for r in threaded] == list(self.comparator.providers)
+        assert threaded == sequential
+
+    def test_assess_text_completeness_counts_repeated_words(self):
+        """Test each occurrence of a repeated word must be transcribed."""
+        doc = SimpleNamespace(transcript=SimpleNamespace(text="the cat saw the dog"))
+
+        completeness = self.comparator._assess_text_completeness(
+            doc, {"text": "The cat saw the dog and the bird"}
+        )
+
+        assert completeness == pytest.approx(5 / 8)
+
+    def test_conversion_reused_for_identical_samples(self):
+        """Test an identical sample is converted once per provider and comparator."""
+        whisper = self.comparator.providers["whisper"]
+        calls = []
+
+        class CountingConverter:
+            def convert(self, data):
+                calls.append(data)
+                return whisper.convert(data)
+
+        self.comparator.providers = {"counting": CountingConverter()}
+        sample = {
+            "text": "Hello world",
+            "segments": [{"start": 0.0, "end": 1.0, "text": "Hello world"}],
+        }
+
+        first = self.comparator.analyze_quality("counting", sample)
+        second = self.comparator.analyze_quality("counting", dict(reversed(sample.items())))
+
+        assert first == second
+        assert len(calls) == 1
+
+        self.comparator.analyze_quality("counting", {**sample, "text": "Hello"})
+        assert len(calls) == 2
+
+    @pytest.mark.parametrize("max_workers", [None, 3])
+    def test_sample_key_computed_once_per_comparison(self, monkeypatch, max_workers):
+        """Test a comparison serializes the sample once for all providers."""
+        from wtf_transcript_converter.cross_provider import quality
+
+        calls = []
+
+        def counting_dumps(obj):
+            calls.append(obj)
+            return b"sample"
+
+        monkeypatch.setattr(quality, "canonical_dumps", counting_dumps)
+
+        results = self.comparator.compare_quality_across_providers(
+            {"text": "Hello"}, max_workers=max_workers
+        )
+
+        assert len(results) == len(self.comparator.providers)
+        assert len(calls) == 1
+
+    def test_analyze_quality_with_unknown_provider(self):
+        """Test an unknown provider gives zeroed metrics with an error message."""
+        result = self.comparator.analyze_quality("unknown", {"text": "test"})
+
+        assert result.provider == "unknown"
+        assert not result.success
+        assert result.error_message == "Provider unknown not found"
+        assert result.word_count == 0
+        assert result.overall_confidence == 0.0
+
+    def test_analyze_quality_error_handling(self):
+        """Test conversion errors become failed metrics and other errors propagate."""
+
+        class FailingConverter:
+            def __init__(self, error):
+                self.error = error
+
+            def convert(self, data):
+                raise self.error
+
+        class NoneConverter:
+            def convert(self, data):
+                return None
+
+        self.comparator.providers = {
+            "invalid": FailingConverter(ValueError("bad sample")),
+            "mismatched": FailingConverter(KeyError("segments")),
+            "unsupported": FailingConverter(NotImplementedError("no convert")),
+            "buggy": FailingConverter(ZeroDivisionError("division by zero")),
+            "broken": NoneConverter(),
+        }
+
+        result = self.comparator.analyze_quality("invalid", {"text": "test"})
+        assert not result.success
+        assert result.error_message == "bad sample"
+
+        result = self.comparator.analyze_quality("mismatched", {"text": "test"})
+        assert not result.success
+        assert result.error_message == (
+            "[mismatched] Could not convert sample (Original: 'segments')"
+        )
+
+        result = self.comparator.analyze_quality("unsupported", {"text": "test"})
+        assert not result.success
+        assert result.error_message.startswith("[unsupported] Could not convert sample")
+
+        with pytest.raises(ZeroDivisionError):
+            self.comparator.analyze_quality("buggy", {"text": "test"})
+
+        result = self.comparator.analyze_quality("broken", {"text": "test"})
+        assert not result.success
+        assert result.error_message == "[broken] Converter returned NoneType, not a WTFDocument"
+
+    def test_compare_quality_with_wtf_sample(self, fixtures_dir):
+        """Test converters that return their own format fail without aborting."""
+        sample_data = json.loads((fixtures_dir / "wtf_sample.json").read_text())
+
+        results = self.comparator.compare_quality_across_providers(sample_data)
+
+        assert [r.provider for r in results] == list(self.comparator.providers)
+        for provider_name in ("whisper", "deepgram", "assemblyai"):
+            result = next(r for r in results if r.provider == provider_name)
+            assert not result.success
+            assert "not a WTFDocument" in result.error_message
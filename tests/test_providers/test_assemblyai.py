@@ -2,6 +2,7 @@
 Tests for AssemblyAI provider converter.
 """
 
+import json
 from pathlib import Path
 
 import pytest
@@ -134,6 +135,17 @@ class TestAssemblyAIConverter:
         assert speaker_a.total_time > 0
         assert speaker_a.confidence > 0
 
+        # Per-speaker totals, in order of first appearance
+        assert list(wtf_doc.speakers) == ["A", "B", "C"]
+        assert speaker_a.total_time == pytest.approx(1.3)
+        assert speaker_a.confidence == pytest.approx(0.96)
+        assert wtf_doc.speakers["B"].total_time == pytest.approx(1.1)
+        assert wtf_doc.speakers["B"].confidence == pytest.approx(0.90)
+        assert wtf_doc.speakers["C"].total_time == pytest.approx(0.8)
+        assert wtf_doc.speakers["C"].confidence == pytest.approx(0.85)
+        assert wtf_doc.transcript.confidence == pytest.approx(0.91)
+        assert wtf_doc.segments[0].confidence == wtf_doc.transcript.confidence
+
     def test_wtf_to_assemblyai_conversion(self, sample_wtf_document):
         """Test converting WTF document to AssemblyAI format."""
         # Convert dict to WTFDocument object
@@ -455,3 +467,127 @@ class TestAssemblyAIConverter:
         assert any("Low overall confidence" in warning for warning in warnings)
         assert any("Low language detection confidence" in warning for warning in warnings)
         assert any("Content safety analysis failed" in warning for warning in warnings)
+
+    def test_word_statistics(self, set_numpy):
+        """Test word confidence and speaker statistics with and without NumPy."""
+        from wtf_transcript_converter.providers import assemblyai
+
+        set_numpy(assemblyai)
+
+        assemblyai_data = {
+            "text": "one two three four",
+            "language_code": "en",
+            "audio_duration": 4.0,
+            "words": [
+                {"text": "one", "start": 0.0, "end": 1.0, "confidence": 0.9, "speaker": "B"},
+                {"text": "two", "start": 1.0, "end": 1.5, "confidence": 0.4, "speaker": "A"},
+                {"text": "three", "start": 1.5, "end": 3.0, "confidence": 0.5, "speaker": "B"},
+                {"text": "four", "start": 3.0, "end": 4.0, "confidence": 0.2},
+            ],
+        }
+
+        wtf_doc = self.converter.convert_to_wtf(assemblyai_data)
+
+        assert wtf_doc.transcript.confidence == pytest.approx(0.5)
+        assert wtf_doc.quality.low_confidence_words == 2
+        assert list(wtf_doc.speakers) == ["B", "A"]
+        assert wtf_doc.speakers["B"].total_time == pytest.approx(2.5)
+        assert wtf_doc.speakers["B"].confidence == pytest.approx(0.7)
+        assert wtf_doc.speakers["A"].total_time == pytest.approx(1.5)
+        assert wtf_doc.speakers["A"].confidence == pytest.approx(0.3)
+
+    @pytest.mark.parametrize(
+        "text, expected",
+        [(",", True), (" - ", True), ("'", True), ("world,", False), ("()", False)],
+    )
+    def test_is_punctuation(self, text, expected):
+        """Test only a single punctuation mark counts as punctuation."""
+        assert self.converter._is_punctuation(text) is expected
+
+    def test_missing_created_timestamp(self):
+        """Test a response without a creation time gets one shared timestamp."""
+        wtf_doc = self.converter.convert_to_wtf({"text": "Test", "words": []})
+
+        assert wtf_doc.metadata.created_at
+        assert wtf_doc.metadata.processed_at == wtf_doc.metadata.created_at
+
+    @pytest.mark.parametrize("empty", [False, True])
+    def test_convert_many(self, sample_assemblyai_data, set_numpy, empty):
+        """Test batch conversion matches converting each input on its own."""
+        from wtf_transcript_converter.providers import assemblyai
+
+        set_numpy(assemblyai)
+
+        inputs = [
+            sample_assemblyai_data,
+            {"text": "Test", "confidence": 0.8, "words": []},
+            {
+                "text": "one two",
+                "created": "2025-01-02T12:00:00Z",
+                "words": [
+                    {"text": "one", "start": 0.0, "end": 1.0, "confidence": 0.3, "speaker": "B"},
+                    {"text": "two", "start": 1.0, "end": 1.5, "confidence": 0.9, "speaker": "A"},
+                ],
+            },
+            sample_assemblyai_data,
+        ]
+        if empty:
+            inputs = []
+
+        wtf_docs = self.converter.convert_many(iter(inputs))
+
+        assert len(wtf_docs) == len(inputs)
+        for wtf_doc, assemblyai_data in zip(wtf_docs, inputs):
+            expected = self.converter.convert_to_wtf(assemblyai_data)
+            assert wtf_doc.transcript.confidence == pytest.approx(expected.transcript.confidence)
+            assert wtf_doc.quality.low_confidence_words == expected.quality.low_confidence_words
+            assert wtf_doc.words == expected.words
+            assert wtf_doc.extensions == expected.extensions
+            if expected.speakers:
+                for speaker_id, speaker in expected.speakers.items():
+                    assert wtf_doc.speakers[speaker_id].total_time == pytest.approx(
+                        speaker.total_time
+                    )
+                    assert wtf_doc.speakers[speaker_id].confidence == pytest.approx(
+                        speaker.confidence
+                    )
+            else:
+                assert wtf_doc.speakers is None
+
+    def test_bytes_round_trip(self, sample_assemblyai_data):
+        """Test converting from raw JSON bytes and back to serialized JSON."""
+        raw = json.dumps(sample_assemblyai_data).encode("utf-8")
+
+        wtf_doc = self.converter.from_assemblyai_bytes(raw)
+        assert wtf_doc.words == self.converter.convert_to_wtf(sample_assemblyai_data).words
+
+        serialized = self.converter.to_assemblyai_bytes(wtf_doc)
+        assert isinstance(serialized, bytes)
+        assert json.loads(serialized) == self.converter.convert_from_wtf(wtf_doc)
+
+    def test_conversion_without_extensions(self, sample_assemblyai_data):
+        """Test extensions are skipped on request and convert back with defaults."""
+        wtf_doc = self.converter.convert_to_wtf(sample_assemblyai_data, include_extensions=False)
+        [batch_doc] = self.converter.convert_many(
+            [sample_assemblyai_data], include_extensions=False
+        )
+
+        assert wtf_doc.extensions is None
+        assert batch_doc.extensions is None
+        assert wtf_doc.words == self.converter.convert_to_wtf(sample_assemblyai_data).words
+        assert self.converter.convert_from_wtf(wtf_doc)["id"] == "wtf-converted"
+
+    @pytest.mark.parametrize(
+        "confidence, expected",
+        [
+            (0.0, "low"),
+            (0.69, "low"),
+            (0.7, "medium"),
+            (0.89, "medium"),
+            (0.9, "high"),
+            (1, "high"),
+        ],
+    )
+    def test_audio_quality_tiers(self, confidence, expected):
+        """Test audio quality tier boundaries."""
+        assert self.converter._assess_audio_quality({"confidence": confidence}) == expected
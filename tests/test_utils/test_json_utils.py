@@ -0,0 +1,73 @@
+"""Tests for JSON utilities."""
+
+import json
+
+import pytest
+
+from wtf_transcript_converter.utils import json_utils
+from wtf_transcript_converter.utils.json_utils import canonical_dumps, dumps, load_file, loads
+
+
+class TestJsonUtils:
+    """Test JSON utility functions."""
+
+    def test_loads_bytes(self):
+        """Test parsing JSON from bytes."""
+        assert loads(b'{"text": "hello", "duration": 1.5}') == {"text": "hello", "duration": 1.5}
+
+    def test_loads_str(self):
+        """Test parsing JSON from text."""
+        assert loads("[1, 2, 3]") == [1, 2, 3]
+
+    def test_loads_invalid(self):
+        """Test that invalid JSON raises the stdlib decode error."""
+        with pytest.raises(json.JSONDecodeError):
+            loads(b"{not json")
+
+    def test_load_file(self, tmp_path):
+        """Test reading and parsing a UTF-8 JSON file."""
+        path = tmp_path / "data.json"
+        path.write_bytes(dumps({"text": "héllo"}))
+        assert load_file(path) == {"text": "héllo"}
+        assert load_file(str(path)) == {"text": "héllo"}
+
+    def test_dumps_returns_bytes(self):
+        """Test serializing to UTF-8 bytes."""
+        data = dumps({"text": "héllo"})
+        assert isinstance(data, bytes)
+        assert "héllo" in data.decode("utf-8")
+
+    def test_dumps_indented(self):
+        """Test serialized output is indented."""
+        assert b'\n  "a": 1' in dumps({"a": 1})
+
+    def test_dumps_non_string_keys(self):
+        """Test non-string keys are serialized like the stdlib."""
+        assert json.loads(dumps({1: "one"})) == {"1": "one"}
+
+    def test_roundtrip(self):
+        """Test dumps/loads roundtrip."""
+        data = {"segments": [{"id": 0, "start": 0.0, "end": 1.25, "text": "hi"}], "x": None}
+        assert loads(dumps(data)) == data
+
+    def test_stdlib_fallback(self, monkeypatch):
+        """Test the stdlib fallback when orjson is unavailable."""
+        monkeypatch.setattr(json_utils, "ORJSON_AVAILABLE", False)
+        data = {"text": "héllo", "values": [1, 2.5]}
+        assert loads(dumps(data)) == data
+        assert dumps(data) == json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+    @pytest.mark.parametrize("orjson_available", [True, False])
+    def test_canonical_dumps(self, monkeypatch, orjson_available):
+        """Test canonical output ignores key order and rejects unserializable data."""
+        if orjson_available and not json_utils.ORJSON_AVAILABLE:
+            pytest.skip("orjson not installed")
+        monkeypatch.setattr(json_utils, "ORJSON_AVAILABLE", orjson_available)
+
+        first = canonical_dumps({"b": [1, {"y": 2, "x": 1}], "a": "héllo"})
+        second = canonical_dumps({"a": "héllo", "b": [1, {"x": 1, "y": 2}]})
+
+        assert first == second
+        assert json.loads(first) == {"a": "héllo", "b": [1, {"x": 1, "y": 2}]}
+        with pytest.raises(TypeError):
+            canonical_dumps({"a": object()})